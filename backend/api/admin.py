@@ -7,12 +7,136 @@ The admin panel provides a user-friendly interface to manage database records.
 Access the admin panel at: http://localhost:8000/admin/
 """
 
+import re
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.text import smart_split
 from .models import (
     User, Property, PropertyImage, Unit, Tenant, Lease, Payment,
     Expense, Document, Notification, Account, JournalEntry, JournalEntryLine
 )
+from .caching import account_chart
+from .pagination import LargeTablePaginator
+
+
+# ==================== SHARED ADMIN HELPERS ====================
+class ChangeListOnlyMixin:
+    """
+    Mixin that loads only ``list_only_fields`` on the change list page
+    
+    The change list renders a handful of columns, so there is no need to
+    pull every column (including long text fields) for each row. Edit pages,
+    autocomplete lookups and actions (which POST to the change list URL)
+    still load complete rows.
+    """
+    list_only_fields = ()
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = getattr(request, 'resolver_match', None)
+        changelist = '%s_%s_changelist' % (self.opts.app_label, self.opts.model_name)
+        if (self.list_only_fields and request.method == 'GET'
+                and match and match.url_name == changelist):
+            queryset = queryset.only(*self.list_only_fields)
+        return queryset
+
+
+class FullTextSearchMixin:
+    """
+    Mixin that searches long text columns through a full-text index
+    
+    The columns in ``fulltext_search_fields`` are left out of ``search_fields``
+    and matched here instead. On MySQL this uses the FULLTEXT indexes
+    (word prefix matching); on PostgreSQL the trigram indexes back the
+    regular icontains lookup; other databases fall back to icontains.
+    """
+    fulltext_search_fields = ()
+    
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        words = [bit.strip('"\'') for bit in smart_split(search_term) if bit.strip('"\'')]
+        if not self.fulltext_search_fields or not words:
+            return results, may_have_duplicates
+        
+        if connection.vendor == 'mysql':
+            # Boolean mode: every word must appear, matched by prefix
+            terms = [re.sub(r'[+\-<>()~*"@]', ' ', word).split() for word in words]
+            against = ' '.join('+%s*' % term for group in terms for term in group)
+            if not against:
+                return results, may_have_duplicates
+            quote = connection.ops.quote_name
+            columns = ', '.join(
+                quote(self.opts.get_field(name).column) for name in self.fulltext_search_fields
+            )
+            sql = 'SELECT %s FROM %s WHERE MATCH (%s) AGAINST (%%s IN BOOLEAN MODE)' % (
+                quote(self.opts.pk.column), quote(self.opts.db_table), columns
+            )
+            matches = queryset.filter(pk__in=RawSQL(sql, [against]))
+        else:
+            condition = Q()
+            for word in words:
+                condition &= Q(*[
+                    ('%s__icontains' % name, word) for name in self.fulltext_search_fields
+                ], _connector=Q.OR)
+            matches = queryset.filter(condition)
+        return results | matches, may_have_duplicates
+
+
+class CachedChoicesMixin:
+    """
+    Mixin that evaluates foreign key choices once per request
+    
+    Fields listed in ``cached_choice_fields`` build their select options on
+    first use and keep them on the request, keyed by model and field name.
+    Inline rows and the empty template form then reuse the same list instead
+    of querying for it again.
+    """
+    cached_choice_fields = ()
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if formfield is None or db_field.name not in self.cached_choice_fields:
+            return formfield
+        
+        cache = request.__dict__.setdefault('_cached_choices', {})
+        key = (db_field.model._meta.label, db_field.name)
+        if key not in cache:
+            cache[key] = self.load_choices(db_field, formfield)
+        formfield.choices = cache[key]
+        return formfield
+    
+    def load_choices(self, db_field, formfield):
+        # iter() keeps list() from issuing a separate COUNT query
+        return list(iter(formfield.choices))
+
+
+class PropertyListFilter(admin.RelatedFieldListFilter):
+    """
+    Property filter that loads only the columns its labels are built from
+    """
+    def field_choices(self, field, request, model_admin):
+        properties = Property.objects.only('id', 'name', 'street').order_by('name')
+        return [(prop.pk, str(prop)) for prop in properties]
+
+
+def active_accounts():
+    """
+    Accounts offered in account selects, loading only what their labels need
+    """
+    return Account.objects.filter(is_active=True).only('id', 'code', 'name').order_by('code')
+
+
+def account_choices(formfield):
+    """
+    Account select options taken from the cached chart of accounts
+
+    The field's queryset is still used to validate the submitted account.
+    """
+    return [('', formfield.empty_label)] + account_chart()
 
 
 # ==================== USER ADMIN ====================
@@ -51,18 +175,27 @@ class PropertyImageInline(admin.TabularInline):
     Allows editing property images directly from the property edit page.
     """
     model = PropertyImage
-    extra = 1
+    extra = 0
+    show_change_link = False
     fields = ['image', 'caption', 'is_primary']
+    
+    def get_queryset(self, request):
+        """
+        Join the property used in each image's label
+        """
+        return super().get_queryset(request).select_related('property')
 
 
 @admin.register(Property)
-class PropertyAdmin(admin.ModelAdmin):
+class PropertyAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for Property model
     """
     list_display = ['name', 'landlord', 'property_type', 'status', 'region', 'district', 'created_at']
-    list_filter = ['property_type', 'status', 'region']
-    search_fields = ['name', 'description', 'street', 'region', 'district']
+    list_filter = ['property_type', 'status']
+    search_fields = ['name', 'street', 'region', 'district']
+    fulltext_search_fields = ('description',)
+    autocomplete_fields = ['landlord']
     inlines = [PropertyImageInline]
     
     fieldsets = (
@@ -85,8 +218,11 @@ class UnitAdmin(admin.ModelAdmin):
     Admin configuration for Unit model
     """
     list_display = ['unit_number', 'property', 'floor', 'rent_amount', 'status', 'bedrooms', 'bathrooms']
-    list_filter = ['status', 'property']
+    list_select_related = ('property',)
+    list_filter = ['status', ('property', PropertyListFilter)]
     search_fields = ['unit_number', 'property__name']
+    ordering = ['property', 'unit_number']
+    autocomplete_fields = ['property']
     
     fieldsets = (
         ('Basic Information', {
@@ -108,7 +244,8 @@ class TenantAdmin(admin.ModelAdmin):
     Admin configuration for Tenant model
     """
     list_display = ['user', 'phone', 'identification_number', 'occupation', 'created_at']
-    search_fields = ['user__username', 'user__email', 'phone', 'identification_number']
+    search_fields = ['=identification_number', '^user__username', '^user__email', '^phone']
+    autocomplete_fields = ['user']
     
     fieldsets = (
         ('User Account', {
@@ -127,21 +264,39 @@ class TenantAdmin(admin.ModelAdmin):
             'fields': ('occupation', 'employer', 'notes')
         }),
     )
+    
+    def get_queryset(self, request):
+        """
+        Join the user account, which is displayed and searched on
+        """
+        return super().get_queryset(request).select_related('user')
 
 
 # ==================== LEASE ADMIN ====================
 @admin.register(Lease)
-class LeaseAdmin(admin.ModelAdmin):
+class LeaseAdmin(ChangeListOnlyMixin, admin.ModelAdmin):
     """
     Admin configuration for Lease model
     """
     list_display = ['property', 'unit', 'tenant', 'landlord', 'start_date', 'end_date', 'monthly_rent', 'status']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    list_select_related = ('property', 'unit__property', 'tenant__user', 'landlord')
+    list_only_fields = (
+        'property__name', 'property__street',
+        'unit__unit_number', 'unit__property__name', 'unit__property__street',
+        'tenant__user__username', 'tenant__user__first_name', 'tenant__user__last_name',
+        'landlord__username', 'landlord__role',
+        'start_date', 'end_date', 'monthly_rent', 'status',
+    )
     list_filter = ['status', 'start_date', 'end_date']
     search_fields = ['property__name', 'unit__unit_number', 'tenant__user__username']
+    ordering = ['-start_date']
+    autocomplete_fields = ['unit', 'tenant', 'landlord']
     
     fieldsets = (
         ('Parties', {
-            'fields': ('property', 'unit', 'tenant', 'landlord')
+            'fields': ('unit', 'tenant', 'landlord')
         }),
         ('Lease Terms', {
             'fields': ('start_date', 'end_date', 'monthly_rent', 'security_deposit', 'status')
@@ -150,21 +305,39 @@ class LeaseAdmin(admin.ModelAdmin):
             'fields': ('document', 'notes')
         }),
     )
+    
+    def get_queryset(self, request):
+        """
+        Join the lease parties so searches and row labels need no extra queries
+        """
+        return super().get_queryset(request).select_related(
+            'property', 'unit__property', 'tenant__user', 'landlord'
+        )
 
 
 # ==================== PAYMENT ADMIN ====================
 @admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(ChangeListOnlyMixin, admin.ModelAdmin):
     """
     Admin configuration for Payment model
     """
     list_display = ['tenant', 'property', 'amount', 'payment_method', 'due_date', 'paid_date', 'status']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    list_select_related = ('tenant__user', 'property')
+    list_only_fields = (
+        'tenant__user__username', 'tenant__user__first_name', 'tenant__user__last_name',
+        'property__name', 'property__street',
+        'amount', 'payment_method', 'due_date', 'paid_date', 'status',
+    )
     list_filter = ['status', 'payment_method', 'due_date']
-    search_fields = ['tenant__user__username', 'transaction_id']
+    search_fields = ['=transaction_id', '^tenant__user__username']
+    ordering = ['-due_date']
+    autocomplete_fields = ['lease']
     
     fieldsets = (
         ('Payment Details', {
-            'fields': ('tenant', 'property', 'lease', 'amount', 'payment_method', 'transaction_id')
+            'fields': ('lease', 'amount', 'payment_method', 'transaction_id')
         }),
         ('Dates and Status', {
             'fields': ('due_date', 'paid_date', 'status')
@@ -173,17 +346,27 @@ class PaymentAdmin(admin.ModelAdmin):
             'fields': ('proof_document', 'notes')
         }),
     )
+    
+    def get_queryset(self, request):
+        """
+        Join the tenant and property referenced by each payment
+        """
+        return super().get_queryset(request).select_related('tenant__user', 'property')
 
 
 # ==================== EXPENSE ADMIN ====================
 @admin.register(Expense)
-class ExpenseAdmin(admin.ModelAdmin):
+class ExpenseAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for Expense model
     """
     list_display = ['title', 'property', 'category', 'amount', 'date']
+    list_select_related = ('property',)
     list_filter = ['category', 'date']
-    search_fields = ['title', 'description', 'property__name']
+    search_fields = ['title', 'property__name']
+    ordering = ['-date']
+    fulltext_search_fields = ('description',)
+    autocomplete_fields = ['property']
     
     fieldsets = (
         ('Expense Information', {
@@ -200,13 +383,29 @@ class ExpenseAdmin(admin.ModelAdmin):
 
 # ==================== DOCUMENT ADMIN ====================
 @admin.register(Document)
-class DocumentAdmin(admin.ModelAdmin):
+class DocumentAdmin(ChangeListOnlyMixin, admin.ModelAdmin):
     """
     Admin configuration for Document model
     """
     list_display = ['title', 'file_type', 'lease', 'user', 'property', 'uploaded_by', 'created_at']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    list_select_related = (
+        'lease__property', 'lease__unit', 'lease__tenant__user',
+        'user', 'property', 'uploaded_by',
+    )
+    list_only_fields = (
+        'title', 'file_type', 'created_at',
+        'lease__property__name', 'lease__unit__unit_number',
+        'lease__tenant__user__username', 'lease__tenant__user__first_name',
+        'lease__tenant__user__last_name',
+        'user__username', 'user__role',
+        'property__name', 'property__street',
+        'uploaded_by__username', 'uploaded_by__role',
+    )
     list_filter = ['file_type', 'created_at']
     search_fields = ['title', 'description']
+    autocomplete_fields = ['lease', 'user', 'property', 'uploaded_by']
     
     fieldsets = (
         ('Document Information', {
@@ -220,13 +419,24 @@ class DocumentAdmin(admin.ModelAdmin):
 
 # ==================== NOTIFICATION ADMIN ====================
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(FullTextSearchMixin, ChangeListOnlyMixin, admin.ModelAdmin):
     """
     Admin configuration for Notification model
     """
     list_display = ['subject', 'lease', 'category', 'priority', 'status', 'created_at']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    list_select_related = ('lease__property', 'lease__unit', 'lease__tenant__user')
+    list_only_fields = (
+        'subject', 'category', 'priority', 'status', 'created_at',
+        'lease__property__name', 'lease__unit__unit_number',
+        'lease__tenant__user__username', 'lease__tenant__user__first_name',
+        'lease__tenant__user__last_name',
+    )
     list_filter = ['category', 'priority', 'status', 'created_at']
-    search_fields = ['subject', 'description']
+    search_fields = ['subject']
+    fulltext_search_fields = ('description',)
+    autocomplete_fields = ['lease', 'responded_by']
     
     fieldsets = (
         ('Notification Details', {
@@ -240,13 +450,15 @@ class NotificationAdmin(admin.ModelAdmin):
 
 # ==================== ACCOUNTING ADMIN ====================
 @admin.register(Account)
-class AccountAdmin(admin.ModelAdmin):
+class AccountAdmin(CachedChoicesMixin, admin.ModelAdmin):
     """
     Admin configuration for Account model
     """
     list_display = ['code', 'name', 'account_type', 'balance', 'is_active']
     list_filter = ['account_type', 'is_active']
-    search_fields = ['code', 'name', 'description']
+    search_fields = ['^code', '^name']
+    ordering = ['code']
+    cached_choice_fields = ['parent_account']
     
     fieldsets = (
         ('Account Information', {
@@ -259,17 +471,41 @@ class AccountAdmin(admin.ModelAdmin):
             'fields': ('is_active',)
         }),
     )
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'parent_account':
+            kwargs['queryset'] = active_accounts()
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
+    def load_choices(self, db_field, formfield):
+        return account_choices(formfield)
 
 
-class JournalEntryLineInline(admin.TabularInline):
+class JournalEntryLineInline(CachedChoicesMixin, admin.TabularInline):
     """
     Inline admin for JournalEntryLine
     
     Allows editing journal entry lines directly from the journal entry edit page.
     """
     model = JournalEntryLine
-    extra = 2
+    extra = 0
+    show_change_link = False
     fields = ['account', 'debit', 'credit', 'description']
+    cached_choice_fields = ['account']
+    
+    def get_queryset(self, request):
+        """
+        Join the account shown on every line
+        """
+        return super().get_queryset(request).select_related('account')
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'account':
+            kwargs['queryset'] = active_accounts()
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
+    def load_choices(self, db_field, formfield):
+        return account_choices(formfield)
 
 
 @admin.register(JournalEntry)
@@ -278,8 +514,13 @@ class JournalEntryAdmin(admin.ModelAdmin):
     Admin configuration for JournalEntry model
     """
     list_display = ['id', 'entry_date', 'description', 'reference', 'created_by', 'created_at']
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    list_select_related = ('created_by',)
     list_filter = ['entry_date', 'created_at']
     search_fields = ['description', 'reference']
+    ordering = ['-entry_date']
+    autocomplete_fields = ['created_by']
     inlines = [JournalEntryLineInline]
     
     fieldsets = (
@@ -296,5 +537,7 @@ class PropertyImageAdmin(admin.ModelAdmin):
     Admin configuration for PropertyImage model
     """
     list_display = ['property', 'caption', 'is_primary', 'created_at']
+    list_select_related = ('property',)
     list_filter = ['is_primary', 'created_at']
     search_fields = ['property__name', 'caption']
+    autocomplete_fields = ['property']
@@ -11,3 +11,7 @@ class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
     verbose_name = 'Rental Management API'
+    
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
@@ -0,0 +1,64 @@
+"""
+Cached Lookups for Rental Management System
+
+The chart of accounts changes rarely but is read on every journal entry form.
+It is kept in Django's cache (Redis when REDIS_URL is set) and invalidated by
+the Account signal handlers in signals.py.
+
+Dashboard statistics are cached per user for a short time. Instead of
+deleting every user's entry on a change, a shared version number that is part
+of each key is bumped, so all older entries are simply never read again.
+"""
+
+import time
+
+from django.core.cache import cache
+
+from .models import Account
+
+ACCOUNT_CHART_KEY = 'accounts:chart'
+ACCOUNT_CHART_TIMEOUT = 60 * 60
+
+
+def account_chart():
+    """
+    Return (id, label) pairs for all active accounts, ordered by code
+    """
+    return cache.get_or_set(ACCOUNT_CHART_KEY, _load_account_chart, ACCOUNT_CHART_TIMEOUT)
+
+
+def _load_account_chart():
+    return [
+        (account_id, f"{code} - {name}")
+        for account_id, code, name in Account.objects.filter(is_active=True)
+        .order_by('code').values_list('id', 'code', 'name')
+    ]
+
+
+def clear_account_chart():
+    cache.delete(ACCOUNT_CHART_KEY)
+
+
+DASHBOARD_VERSION_KEY = 'dashboard:version'
+DASHBOARD_STATS_TIMEOUT = 45
+
+
+def dashboard_stats_key(user):
+    """
+    Return the cache key for a user's dashboard statistics
+    """
+    version = cache.get_or_set(DASHBOARD_VERSION_KEY, _new_dashboard_version, None)
+    return f'dashboard:{version}:{user.pk}:{user.role}'
+
+
+def _new_dashboard_version():
+    # Start from the clock so a version evicted from the cache is not reused
+    return time.time_ns()
+
+
+def clear_dashboard_stats():
+    try:
+        cache.incr(DASHBOARD_VERSION_KEY)
+    except ValueError:
+        # No version stored yet, so nothing has been cached under it
+        pass
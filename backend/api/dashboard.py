@@ -0,0 +1,91 @@
+"""
+Dashboard Totals for Rental Management System
+
+The admin dashboard shows counts and sums over whole tables. They are
+computed here, either live or from the snapshot row that the
+refresh_dashboard_snapshot command keeps up to date.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .models import DashboardSnapshot, Lease, Payment, Property, Tenant, Unit
+
+# How old a snapshot may be before the dashboard counts live instead
+SNAPSHOT_MAX_AGE = timedelta(minutes=5)
+
+SNAPSHOT_PK = 1
+
+SYSTEM_TOTAL_FIELDS = (
+    'total_properties', 'total_units', 'total_tenants', 'total_leases',
+    'active_leases', 'total_payments', 'completed_payments',
+    'pending_payments', 'overdue_payments', 'total_revenue',
+)
+
+
+def payment_summary(payments):
+    """
+    Count payments by status and total the completed ones in a single query
+    """
+    return payments.aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='completed')),
+        pending=Count('id', filter=Q(status='pending')),
+        overdue=Count('id', filter=Q(status='overdue')),
+        revenue=Sum('amount', filter=Q(status='completed')),
+    )
+
+
+def count_system_totals():
+    """
+    Compute the system-wide dashboard totals from the live tables
+    
+    Units, leases and payments of soft-deleted properties are not counted.
+    """
+    lease_counts = Lease.objects.filter(property__is_deleted=False).aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+    )
+    payment_counts = payment_summary(Payment.objects.filter(property__is_deleted=False))
+    return {
+        'total_properties': Property.objects.count(),
+        'total_units': Unit.objects.filter(property__is_deleted=False).count(),
+        'total_tenants': Tenant.objects.count(),
+        'total_leases': lease_counts['total'],
+        'active_leases': lease_counts['active'],
+        'total_payments': payment_counts['total'],
+        'completed_payments': payment_counts['completed'],
+        'pending_payments': payment_counts['pending'],
+        'overdue_payments': payment_counts['overdue'],
+        'total_revenue': payment_counts['revenue'] or 0,
+    }
+
+
+def system_totals():
+    """
+    Return the system-wide dashboard totals
+    
+    Uses the snapshot while it is younger than SNAPSHOT_MAX_AGE, so the
+    dashboard does not scan every table on each request. Without a recent
+    snapshot (the refresh command is not scheduled) the totals are counted.
+    """
+    snapshot = DashboardSnapshot.objects.filter(
+        pk=SNAPSHOT_PK, updated_at__gte=timezone.now() - SNAPSHOT_MAX_AGE
+    ).first()
+    if snapshot is None:
+        return count_system_totals()
+    totals = {name: getattr(snapshot, name) for name in SYSTEM_TOTAL_FIELDS}
+    totals['total_revenue'] = totals['total_revenue'] or 0
+    return totals
+
+
+def refresh_dashboard_snapshot():
+    """
+    Recompute the system-wide totals and store them in the snapshot row
+    """
+    snapshot, _ = DashboardSnapshot.objects.update_or_create(
+        pk=SNAPSHOT_PK, defaults=count_system_totals()
+    )
+    return snapshot
@@ -0,0 +1,68 @@
+"""
+Custom Model Fields for Rental Management System
+
+This file defines model fields shared by the models in models.py.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import models
+
+
+class MoneyField(models.DecimalField):
+    """
+    Money amount stored as a whole number of cents
+
+    In Python, forms and the API it behaves exactly like a DecimalField with
+    two decimal places. The database column is a BIGINT of minor units, so
+    sums, comparisons and sorting run on plain integers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('max_digits', 15)
+        kwargs['decimal_places'] = 2
+        super().__init__(*args, **kwargs)
+
+    def get_internal_type(self):
+        return 'BigIntegerField'
+
+    def to_cents(self, value):
+        if value is None or hasattr(value, 'as_sql'):
+            return value
+        amount = self.to_python(value)
+        return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        return self.to_cents(value)
+
+    def get_db_prep_save(self, value, connection):
+        return self.to_cents(value)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return Decimal(value).scaleb(-2).quantize(Decimal('0.01'))
+
+
+class EnumCharField(models.CharField):
+    """
+    Choice field stored as a native ENUM column on MySQL
+
+    MySQL keeps an ENUM value as a one or two byte index into the list of
+    choices, so filtering and grouping on it compares small integers instead
+    of strings. Other databases keep the regular varchar column. Values are
+    still the choice strings everywhere in Python and the API.
+
+    Note that MySQL sorts ENUM columns by the order of the choices, not
+    alphabetically.
+    """
+
+    def db_type(self, connection):
+        if connection.vendor == 'mysql' and self.choices:
+            values = ', '.join(
+                "'%s'" % str(value).replace("'", "''") for value, _ in self.flatchoices
+            )
+            return 'enum(%s)' % values
+        return super().db_type(connection)
@@ -0,0 +1,89 @@
+"""
+Filter Sets for Rental Management System
+
+Query parameter filters for the API list endpoints. Declaring the FilterSet
+classes here builds each one once at import; a viewset that only lists
+``filterset_fields`` gets a new FilterSet class generated on every request.
+"""
+
+from django.contrib.auth import get_user_model
+from django_filters.rest_framework import FilterSet
+
+from .models import (
+    Property, Unit, Tenant, Lease, Payment, Expense, Document,
+    Notification, Account, JournalEntry, JournalEntryLine
+)
+
+User = get_user_model()
+
+
+class UserFilter(FilterSet):
+    class Meta:
+        model = User
+        fields = ['role', 'is_active']
+
+
+class PropertyFilter(FilterSet):
+    class Meta:
+        model = Property
+        fields = ['property_type', 'status', 'landlord', 'region', 'district']
+
+
+class UnitFilter(FilterSet):
+    class Meta:
+        model = Unit
+        fields = ['property', 'status', 'floor']
+
+
+class TenantFilter(FilterSet):
+    class Meta:
+        model = Tenant
+        fields = ['user']
+
+
+class LeaseFilter(FilterSet):
+    class Meta:
+        model = Lease
+        fields = ['property', 'unit', 'tenant', 'landlord', 'status']
+
+
+class PaymentFilter(FilterSet):
+    class Meta:
+        model = Payment
+        fields = ['tenant', 'property', 'lease', 'status', 'payment_method']
+
+
+class ExpenseFilter(FilterSet):
+    class Meta:
+        model = Expense
+        fields = ['property', 'category']
+
+
+class DocumentFilter(FilterSet):
+    class Meta:
+        model = Document
+        fields = ['file_type', 'lease', 'user', 'property']
+
+
+class NotificationFilter(FilterSet):
+    class Meta:
+        model = Notification
+        fields = ['lease', 'category', 'priority', 'status']
+
+
+class AccountFilter(FilterSet):
+    class Meta:
+        model = Account
+        fields = ['account_type', 'is_active']
+
+
+class JournalEntryFilter(FilterSet):
+    class Meta:
+        model = JournalEntry
+        fields = ['entry_date', 'created_by']
+
+
+class JournalEntryLineFilter(FilterSet):
+    class Meta:
+        model = JournalEntryLine
+        fields = ['journal_entry', 'account']
@@ -0,0 +1,54 @@
+"""
+Image Processing for Rental Management System
+
+This file builds the resized variants of uploaded property images.
+"""
+
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from .models import ImageVariant
+
+WEBP_QUALITY = 80
+
+
+def generate_image_variants(property_image):
+    """
+    Create WebP copies of a property image at each ImageVariant width
+
+    Only widths smaller than the original are generated. The image is read
+    from storage once and downscaled step by step from the largest width, so
+    each resize works on the previous (smaller) result. Existing variants of
+    the image are replaced.
+    """
+    with property_image.image.open('rb') as source:
+        original = Image.open(source)
+        original = ImageOps.exif_transpose(original)
+        original.load()
+
+    if original.mode not in ('RGB', 'RGBA'):
+        original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+
+    stem = os.path.splitext(os.path.basename(property_image.image.name))[0]
+    resized = original
+    variants = []
+    for width in sorted(ImageVariant.WIDTHS, reverse=True):
+        if width >= original.width:
+            continue
+        height = max(1, round(original.height * width / original.width))
+        resized = resized.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+
+        buffer = BytesIO()
+        resized.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+        variant = ImageVariant(image=property_image, width=width, format='webp')
+        variant.file.save(f'{stem}_{width}.webp', ContentFile(buffer.getvalue()), save=False)
+        variants.append(variant)
+
+    with transaction.atomic():
+        ImageVariant.objects.filter(image=property_image).delete()
+        ImageVariant.objects.bulk_create(variants)
+    return variants
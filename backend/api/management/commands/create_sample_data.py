@@ -10,18 +10,32 @@ Usage:
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
 from api.models import (
     Property, PropertyImage, Unit, Tenant, Lease, Payment, Expense, Notification
 )
-from datetime import datetime, timedelta
+from datetime import timedelta
 from decimal import Decimal
+from itertools import product
 
 User = get_user_model()
 
+# Sample payments for the last 3 months, keyed by months ago:
+# (status, days between due date and payment or None if unpaid)
+PAYMENT_STATUS_MAP = {
+    0: ('pending', None),
+    1: ('completed', 2),
+    2: ('completed', -1),
+}
+
 
 class Command(BaseCommand):
     help = 'Creates sample data for testing the rental management system'
     
+    # Commit all sample rows together instead of once per write
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write('Creating sample data...')
         
@@ -37,7 +51,7 @@ class Command(BaseCommand):
         
         # Create Units
         self.stdout.write('Creating units...')
-        units = self.create_units(properties)
+        units, occupied_units = self.create_units(properties)
         
         # Create Tenant Profiles
         self.stdout.write('Creating tenant profiles...')
@@ -45,7 +59,7 @@ class Command(BaseCommand):
         
         # Create Leases
         self.stdout.write('Creating leases...')
-        leases = self.create_leases(properties, units, tenant_profiles, landlords)
+        leases = self.create_leases(occupied_units, tenant_profiles)
         
         # Create Payments
         self.stdout.write('Creating payments...')
@@ -77,66 +91,57 @@ class Command(BaseCommand):
                 'role': 'admin',
                 'is_staff': True,
                 'is_superuser': True,
+                'password': make_password('admin123'),
             }
         )
         if created:
-            admin.set_password('admin123')
-            admin.save()
             self.stdout.write(f'  Created admin user: {admin.username}')
         return admin
     
     def create_landlords(self):
         """Create landlord users"""
-        landlords = []
         landlord_data = [
             {'username': 'landlord1', 'first_name': 'John', 'last_name': 'Smith'},
             {'username': 'landlord2', 'first_name': 'Jane', 'last_name': 'Doe'},
         ]
-        
-        for data in landlord_data:
-            landlord, created = User.objects.get_or_create(
-                username=data['username'],
-                defaults={
-                    'email': f"{data['username']}@rental.com",
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'role': 'landlord',
-                }
-            )
-            if created:
-                landlord.set_password('landlord123')
-                landlord.save()
-                self.stdout.write(f'  Created landlord: {landlord.username}')
-            landlords.append(landlord)
-        
-        return landlords
+        return self.create_users(landlord_data, 'landlord', 'landlord123')
     
     def create_tenants(self):
         """Create tenant users"""
-        tenants = []
         tenant_data = [
             {'username': 'tenant1', 'first_name': 'Alice', 'last_name': 'Johnson'},
             {'username': 'tenant2', 'first_name': 'Bob', 'last_name': 'Williams'},
             {'username': 'tenant3', 'first_name': 'Carol', 'last_name': 'Brown'},
         ]
+        return self.create_users(tenant_data, 'tenant', 'tenant123')
+    
+    def create_users(self, user_data, role, raw_password):
+        """Create users of one role in a single insert, skipping existing usernames"""
+        usernames = [data['username'] for data in user_data]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        
+        # Every user of a role shares the same password, so hash it only once
+        password = make_password(raw_password)
         
-        for data in tenant_data:
-            tenant, created = User.objects.get_or_create(
+        new_users = [
+            User(
                 username=data['username'],
-                defaults={
-                    'email': f"{data['username']}@rental.com",
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'role': 'tenant',
-                }
+                email=f"{data['username']}@rental.com",
+                first_name=data['first_name'],
+                last_name=data['last_name'],
+                role=role,
+                password=password,
             )
-            if created:
-                tenant.set_password('tenant123')
-                tenant.save()
-                self.stdout.write(f'  Created tenant: {tenant.username}')
-            tenants.append(tenant)
+            for data in user_data
+            if data['username'] not in existing
+        ]
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        for user in new_users:
+            self.stdout.write(f'  Created {role}: {user.username}')
         
-        return tenants
+        # Re-read the rows so every user has its primary key
+        users = User.objects.in_bulk(usernames, field_name='username')
+        return [users[username] for username in usernames]
     
     def create_properties(self, landlords):
         """Create sample properties"""
@@ -179,7 +184,7 @@ class Command(BaseCommand):
                 'bedrooms': 12,
                 'bathrooms': 12,
                 'area_sqft': Decimal('12000'),
-                'status': 'available',
+                'status': 'vacant',
             },
         ]
         
@@ -197,160 +202,201 @@ class Command(BaseCommand):
         return properties
     
     def create_units(self, properties):
-        """Create units for properties"""
-        units = []
+        """Create units for properties, returning all units and the occupied ones"""
+        # Create 3-5 units per property
+        num_units = 4
+        unit_numbers = [f'{chr(65+i)}{i+1}' for i in range(num_units)]  # A1, B2, C3, etc.
         
-        for prop in properties:
-            # Create 3-5 units per property
-            num_units = 4
-            for i in range(num_units):
-                unit, created = Unit.objects.get_or_create(
-                    property=prop,
-                    unit_number=f'{chr(65+i)}{i+1}',  # A1, B2, C3, etc.
-                    defaults={
-                        'floor': (i % 3) + 1,
-                        'bedrooms': 2,
-                        'bathrooms': 1,
-                        'rent_amount': Decimal('1200') + (i * 100),
-                        'status': 'available' if i >= 2 else 'occupied',
-                        'description': f'Unit {chr(65+i)}{i+1} - {prop.name}'
-                    }
-                )
-                if created:
-                    self.stdout.write(f'  Created unit: {unit.unit_number} in {prop.name}')
-                units.append(unit)
+        # One query to find what already exists, one insert for the rest
+        existing = set(
+            Unit.objects.filter(property__in=properties).values_list('property_id', 'unit_number')
+        )
+        new_units = [
+            Unit(
+                property=prop,
+                unit_number=unit_number,
+                floor=(i % 3) + 1,
+                bedrooms=2,
+                bathrooms=1,
+                rent_amount=Decimal('1200') + (i * 100),
+                status='available' if i >= 2 else 'occupied',
+                description=f'Unit {unit_number} - {prop.name}',
+            )
+            for prop in properties
+            for i, unit_number in enumerate(unit_numbers)
+            if (prop.id, unit_number) not in existing
+        ]
+        Unit.objects.bulk_create(new_units, ignore_conflicts=True, batch_size=500)
+        for unit in new_units:
+            self.stdout.write(f'  Created unit: {unit.unit_number} in {unit.property.name}')
         
-        return units
+        # Re-read the rows so every unit has its primary key
+        units_by_key = {
+            (unit.property_id, unit.unit_number): unit
+            for unit in Unit.objects.filter(
+                property__in=properties, unit_number__in=unit_numbers
+            ).select_related('property__landlord')
+        }
+        units = [units_by_key[(prop.id, unit_number)] for prop in properties for unit_number in unit_numbers]
+        return units, [unit for unit in units if unit.status == 'occupied']
     
     def create_tenant_profiles(self, tenants):
         """Create tenant profiles"""
-        profiles = []
-        
-        for tenant in tenants:
-            profile, created = Tenant.objects.get_or_create(
+        existing = set(Tenant.objects.filter(user__in=tenants).values_list('user_id', flat=True))
+        new_profiles = [
+            Tenant(
                 user=tenant,
-                defaults={
-                    'phone': f'+1-555-{1000 + tenants.index(tenant):04d}',
-                    'identification_type': 'Passport',
-                    'identification_number': f'P{10000000 + tenants.index(tenant)}',
-                    'emergency_contact_name': 'Emergency Contact',
-                    'emergency_contact_phone': '+1-555-9999',
-                    'emergency_contact_relationship': 'Family',
-                    'occupation': 'Software Engineer',
-                }
+                phone=f'+1-555-{1000 + idx:04d}',
+                identification_type='Passport',
+                identification_number=f'P{10000000 + idx}',
+                emergency_contact_name='Emergency Contact',
+                emergency_contact_phone='+1-555-9999',
+                emergency_contact_relationship='Family',
+                occupation='Software Engineer',
             )
-            if created:
-                self.stdout.write(f'  Created tenant profile for: {tenant.username}')
-            profiles.append(profile)
+            for idx, tenant in enumerate(tenants)
+            if tenant.id not in existing
+        ]
+        Tenant.objects.bulk_create(new_profiles, ignore_conflicts=True)
+        for profile in new_profiles:
+            self.stdout.write(f'  Created tenant profile for: {profile.user.username}')
         
-        return profiles
+        # Re-read the rows so every profile has its primary key
+        profiles = {
+            profile.user_id: profile
+            for profile in Tenant.objects.filter(user__in=tenants).select_related('user')
+        }
+        return [profiles[tenant.id] for tenant in tenants]
     
-    def create_leases(self, properties, units, tenant_profiles, landlords):
+    def create_leases(self, occupied_units, tenant_profiles):
         """Create lease agreements"""
-        leases = []
-        
-        occupied_units = [u for u in units if u.status == 'occupied']
+        today = timezone.localdate()
+        lease_units = list(zip(occupied_units, tenant_profiles))
         
-        for i, unit in enumerate(occupied_units[:len(tenant_profiles)]):
-            if i >= len(tenant_profiles):
-                break
-            
-            tenant_profile = tenant_profiles[i]
-            landlord = unit.property.landlord
-            
-            start_date = datetime.now().date() - timedelta(days=30 * (i + 1))
-            end_date = start_date + timedelta(days=365)
+        existing = set(
+            Lease.objects.filter(
+                unit__in=[unit for unit, _ in lease_units],
+                tenant__in=tenant_profiles,
+            ).values_list('unit_id', 'tenant_id')
+        )
+        new_leases = []
+        for i, (unit, tenant_profile) in enumerate(lease_units):
+            if (unit.id, tenant_profile.id) in existing:
+                continue
             
-            lease, created = Lease.objects.get_or_create(
+            start_date = today - timedelta(days=30 * (i + 1))
+            new_leases.append(Lease(
                 property=unit.property,
                 unit=unit,
                 tenant=tenant_profile,
-                defaults={
-                    'landlord': landlord,
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'monthly_rent': unit.rent_amount,
-                    'security_deposit': unit.rent_amount * 2,
-                    'status': 'active',
-                    'notes': f'Lease agreement for {tenant_profile.user.get_full_name()}'
-                }
-            )
-            if created:
-                self.stdout.write(f'  Created lease for: {tenant_profile.user.username} - {unit.unit_number}')
-            leases.append(lease)
+                landlord=unit.property.landlord,
+                start_date=start_date,
+                end_date=start_date + timedelta(days=365),
+                monthly_rent=unit.rent_amount,
+                security_deposit=unit.rent_amount * 2,
+                status='active',
+                notes=f'Lease agreement for {tenant_profile.user.get_full_name()}',
+            ))
         
-        return leases
+        Lease.objects.bulk_create(new_leases, ignore_conflicts=True, batch_size=500)
+        for lease in new_leases:
+            self.stdout.write(f'  Created lease for: {lease.tenant.user.username} - {lease.unit.unit_number}')
+        
+        # Re-read the rows so every lease has its primary key
+        leases_by_key = {
+            (lease.unit_id, lease.tenant_id): lease
+            for lease in Lease.objects.filter(
+                unit__in=[unit for unit, _ in lease_units],
+                tenant__in=tenant_profiles,
+            ).select_related('property', 'tenant__user')
+        }
+        return [leases_by_key[(unit.id, tenant_profile.id)] for unit, tenant_profile in lease_units]
     
     def create_payments(self, leases, tenant_profiles, properties):
         """Create payment records"""
-        for lease in leases:
-            # Create payments for the last 3 months
-            for month_ago in range(3):
-                due_date = datetime.now().date() - timedelta(days=30 * month_ago)
-                
-                # Vary payment status
-                if month_ago == 0:
-                    status = 'pending'
-                    paid_date = None
-                elif month_ago == 1:
-                    status = 'completed'
-                    paid_date = due_date + timedelta(days=2)
-                else:
-                    status = 'completed'
-                    paid_date = due_date - timedelta(days=1)
-                
-                payment, created = Payment.objects.get_or_create(
-                    tenant=lease.tenant,
-                    property=lease.property,
-                    lease=lease,
-                    due_date=due_date,
-                    defaults={
-                        'amount': lease.monthly_rent,
-                        'payment_method': 'bank_transfer',
-                        'transaction_id': f'TXN{due_date.strftime("%Y%m%d")}{lease.id}',
-                        'paid_date': paid_date,
-                        'status': status,
-                        'notes': f'Monthly rent payment for {due_date.strftime("%B %Y")}'
-                    }
-                )
-                if created:
-                    self.stdout.write(f'  Created payment: {payment.transaction_id}')
+        existing = set(
+            Payment.objects.filter(lease__in=leases).values_list('lease_id', 'due_date')
+        )
+        today = timezone.localdate()
+        due_dates = {
+            month_ago: today - timedelta(days=30 * month_ago) for month_ago in PAYMENT_STATUS_MAP
+        }
+        
+        payments = []
+        for lease, month_ago in product(leases, PAYMENT_STATUS_MAP):
+            due_date = due_dates[month_ago]
+            if (lease.id, due_date) in existing:
+                continue
+            
+            status, paid_after = PAYMENT_STATUS_MAP[month_ago]
+            payments.append(Payment(
+                tenant=lease.tenant,
+                property=lease.property,
+                lease=lease,
+                due_date=due_date,
+                amount=lease.monthly_rent,
+                payment_method='bank_transfer',
+                transaction_id=f'TXN{due_date:%Y%m%d}{lease.id}',
+                paid_date=due_date + timedelta(days=paid_after) if paid_after is not None else None,
+                status=status,
+                notes=f'Monthly rent payment for {due_date:%B %Y}',
+            ))
+        
+        Payment.objects.bulk_create(payments, batch_size=1000)
+        for payment in payments:
+            self.stdout.write(f'  Created payment: {payment.transaction_id}')
     
     def create_expenses(self, properties):
         """Create expense records"""
-        for prop in properties:
-            expenses_data = [
-                {'title': 'Maintenance', 'category': 'maintenance', 'amount': Decimal('500')},
-                {'title': 'Utilities', 'category': 'utilities', 'amount': Decimal('300')},
-                {'title': 'Insurance', 'category': 'insurance', 'amount': Decimal('800')},
-            ]
-            
-            for data in expenses_data:
-                expense, created = Expense.objects.get_or_create(
-                    property=prop,
-                    title=data['title'],
-                    defaults={
-                        'category': data['category'],
-                        'amount': data['amount'],
-                        'date': datetime.now().date(),
-                        'description': f'{data["title"]} for {prop.name}'
-                    }
-                )
-                if created:
-                    self.stdout.write(f'  Created expense: {expense.title} - {prop.name}')
+        expenses_data = [
+            {'title': 'Maintenance', 'category': 'maintenance', 'amount': Decimal('500')},
+            {'title': 'Utilities', 'category': 'utilities', 'amount': Decimal('300')},
+            {'title': 'Insurance', 'category': 'insurance', 'amount': Decimal('800')},
+        ]
+        today = timezone.localdate()
+        
+        existing = set(
+            Expense.objects.filter(
+                property__in=properties,
+                title__in=[data['title'] for data in expenses_data],
+            ).values_list('property_id', 'title')
+        )
+        expenses = [
+            Expense(
+                property=prop,
+                title=data['title'],
+                category=data['category'],
+                amount=data['amount'],
+                date=today,
+                description=f'{data["title"]} for {prop.name}',
+            )
+            for prop in properties
+            for data in expenses_data
+            if (prop.id, data['title']) not in existing
+        ]
+        Expense.objects.bulk_create(expenses, batch_size=500)
+        for expense in expenses:
+            self.stdout.write(f'  Created expense: {expense.title} - {expense.property.name}')
     
     def create_notifications(self, leases):
         """Create sample notifications"""
-        for i, lease in enumerate(leases[:2]):
-            notification, created = Notification.objects.get_or_create(
+        existing = set(
+            Notification.objects.filter(
+                lease__in=leases[:2], category='maintenance'
+            ).values_list('lease_id', flat=True)
+        )
+        notifications = [
+            Notification(
                 lease=lease,
                 category='maintenance',
-                defaults={
-                    'priority': 'medium',
-                    'subject': 'Maintenance Request',
-                    'description': 'Need repair for leaking faucet in bathroom',
-                    'status': 'pending' if i == 0 else 'resolved',
-                }
+                priority='medium',
+                subject='Maintenance Request',
+                description='Need repair for leaking faucet in bathroom',
+                status='pending' if i == 0 else 'resolved',
             )
-            if created:
-                self.stdout.write(f'  Created notification for lease: {lease.id}')
+            for i, lease in enumerate(leases[:2])
+            if lease.id not in existing
+        ]
+        Notification.objects.bulk_create(notifications, batch_size=500)
+        for notification in notifications:
+            self.stdout.write(f'  Created notification for lease: {notification.lease_id}')
@@ -0,0 +1,50 @@
+"""
+Django Management Command: Purge Deleted Properties
+
+Deleting a property through the API or admin only marks it as deleted.
+This command removes properties that were deleted more than the given number
+of days ago, together with their units, leases, payments and other related
+rows. Each property is purged in its own transaction so a large backlog does
+not hold locks for the whole run.
+
+Usage:
+    python manage.py purge_deleted_properties [--days 30] [--dry-run]
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from api.models import Property
+
+
+class Command(BaseCommand):
+    help = 'Permanently removes properties that were soft-deleted a while ago'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=30,
+            help='Only purge properties deleted at least this many days ago (default: 30)'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='List the properties that would be purged without deleting them'
+        )
+    
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        property_ids = list(
+            Property.all_objects.filter(is_deleted=True, deleted_at__lte=cutoff)
+            .values_list('id', flat=True)
+        )
+        
+        if options['dry_run']:
+            self.stdout.write(f'{len(property_ids)} properties would be purged.')
+            return
+        
+        for property_id in property_ids:
+            with transaction.atomic():
+                Property.all_objects.filter(id=property_id).delete()
+        
+        self.stdout.write(self.style.SUCCESS(f'Purged {len(property_ids)} properties.'))
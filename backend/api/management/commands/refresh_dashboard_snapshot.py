@@ -0,0 +1,24 @@
+"""
+Django Management Command: Refresh Dashboard Snapshot
+
+Recomputes the system-wide totals shown on the admin dashboard and stores
+them in the DashboardSnapshot row. Schedule it to run every minute or two
+(for example from cron); the dashboard counts live whenever the snapshot is
+older than five minutes.
+
+Usage:
+    python manage.py refresh_dashboard_snapshot
+"""
+
+from django.core.management.base import BaseCommand
+from api.dashboard import refresh_dashboard_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the system-wide totals shown on the admin dashboard'
+    
+    def handle(self, *args, **options):
+        snapshot = refresh_dashboard_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f'Dashboard snapshot updated at {snapshot.updated_at:%Y-%m-%d %H:%M:%S}.'
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_create_default_users'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='transaction_id',
+            field=models.CharField(blank=True, db_index=True, help_text='Transaction reference number', max_length=200, null=True),
+        ),
+        migrations.AlterField(
+            model_name='tenant',
+            name='identification_number',
+            field=models.CharField(blank=True, db_index=True, help_text='ID number', max_length=100, null=True),
+        ),
+    ]
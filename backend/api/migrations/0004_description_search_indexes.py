@@ -0,0 +1,54 @@
+"""
+Index the long description columns searched from the admin
+
+MySQL gets FULLTEXT indexes, used by MATCH ... AGAINST in the admin search.
+PostgreSQL gets pg_trgm GIN indexes on UPPER(description), which is the
+expression Django's icontains lookup compiles to, so substring searches stop
+scanning the whole table. Other databases are left unchanged.
+"""
+from django.db import migrations
+
+
+DESCRIPTION_TABLES = ['api_property', 'api_expense', 'api_notification']
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    quote = schema_editor.quote_name
+    if vendor == 'mysql':
+        for table in DESCRIPTION_TABLES:
+            schema_editor.execute('CREATE FULLTEXT INDEX %s ON %s (description)' % (
+                quote('%s_description_ft' % table), quote(table)
+            ))
+    elif vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table in DESCRIPTION_TABLES:
+            schema_editor.execute(
+                'CREATE INDEX IF NOT EXISTS %s ON %s USING GIN (UPPER(description) gin_trgm_ops)' % (
+                    quote('%s_description_trgm' % table), quote(table)
+                )
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    quote = schema_editor.quote_name
+    if vendor == 'mysql':
+        for table in DESCRIPTION_TABLES:
+            schema_editor.execute('DROP INDEX %s ON %s' % (
+                quote('%s_description_ft' % table), quote(table)
+            ))
+    elif vendor == 'postgresql':
+        for table in DESCRIPTION_TABLES:
+            schema_editor.execute('DROP INDEX IF EXISTS %s' % quote('%s_description_trgm' % table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_index_searched_reference_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+ACCOUNT_BALANCES_VIEW = """
+CREATE VIEW account_balances AS
+SELECT
+    a.id AS account_id,
+    COALESCE(SUM(l.debit), 0) AS total_debit,
+    COALESCE(SUM(l.credit), 0) AS total_credit,
+    COALESCE(SUM(l.debit), 0) - COALESCE(SUM(l.credit), 0) AS balance
+FROM api_account a
+LEFT JOIN api_journalentryline l ON l.account_id = a.id
+GROUP BY a.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_composite_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(ACCOUNT_BALANCES_VIEW, 'DROP VIEW account_balances'),
+        migrations.CreateModel(
+            name='AccountBalance',
+            fields=[
+                ('account', models.OneToOneField(help_text='Account these totals belong to', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='ledger_balance', serialize=False, to='api.account')),
+                ('total_debit', models.DecimalField(decimal_places=2, max_digits=17)),
+                ('total_credit', models.DecimalField(decimal_places=2, max_digits=17)),
+                ('balance', models.DecimalField(decimal_places=2, help_text='Total debits minus total credits', max_digits=17)),
+            ],
+            options={
+                'verbose_name': 'Account Balance',
+                'verbose_name_plural': 'Account Balances',
+                'db_table': 'account_balances',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:43
+
+from django.db import migrations, models
+
+
+# SQLite rebuilds the table to add a column, which it refuses to do while a
+# view depends on it, so account_balances is recreated around the change
+ACCOUNT_BALANCES_VIEW = """
+CREATE VIEW account_balances AS
+SELECT
+    a.id AS account_id,
+    COALESCE(SUM(l.debit), 0) AS total_debit,
+    COALESCE(SUM(l.credit), 0) AS total_credit,
+    COALESCE(SUM(l.debit), 0) - COALESCE(SUM(l.credit), 0) AS balance
+FROM api_account a
+LEFT JOIN api_journalentryline l ON l.account_id = a.id
+GROUP BY a.id
+"""
+
+
+def fill_account_paths(apps, schema_editor):
+    """Build the path of every existing account from its parent chain"""
+    Account = apps.get_model('api', 'Account')
+    parents = dict(Account.objects.values_list('id', 'parent_account_id'))
+    paths = {}
+    
+    def path_for(account_id, seen=()):
+        if account_id not in paths:
+            parent_id = parents.get(account_id)
+            if parent_id is None or parent_id in seen:
+                prefix = '/'
+            else:
+                prefix = path_for(parent_id, seen + (account_id,))
+            paths[account_id] = f'{prefix}{account_id}/'
+        return paths[account_id]
+    
+    for account_id in parents:
+        Account.objects.filter(pk=account_id).update(path=path_for(account_id))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_account_balances_view'),
+    ]
+
+    operations = [
+        migrations.RunSQL('DROP VIEW account_balances', ACCOUNT_BALANCES_VIEW),
+        migrations.AddField(
+            model_name='account',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, help_text='Materialized path of account ids from the root, e.g. /1/4/9/', max_length=255),
+        ),
+        migrations.RunPython(fill_account_paths, migrations.RunPython.noop),
+        migrations.RunSQL(ACCOUNT_BALANCES_VIEW, 'DROP VIEW account_balances'),
+    ]
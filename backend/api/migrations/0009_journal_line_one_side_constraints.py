@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+# SQLite rebuilds the table to add a constraint, which it refuses to do while
+# a view depends on it, so account_balances is recreated around the change
+ACCOUNT_BALANCES_VIEW = """
+CREATE VIEW account_balances AS
+SELECT
+    a.id AS account_id,
+    COALESCE(SUM(l.debit), 0) AS total_debit,
+    COALESCE(SUM(l.credit), 0) AS total_credit,
+    COALESCE(SUM(l.debit), 0) - COALESCE(SUM(l.credit), 0) AS balance
+FROM api_account a
+LEFT JOIN api_journalentryline l ON l.account_id = a.id
+GROUP BY a.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_account_path'),
+    ]
+
+    operations = [
+        migrations.RunSQL('DROP VIEW account_balances', ACCOUNT_BALANCES_VIEW),
+        migrations.AddIndex(
+            model_name='journalentryline',
+            index=models.Index(condition=models.Q(('debit__gt', 0)), fields=['journal_entry'], name='jel_debits'),
+        ),
+        migrations.AddIndex(
+            model_name='journalentryline',
+            index=models.Index(condition=models.Q(('credit__gt', 0)), fields=['journal_entry'], name='jel_credits'),
+        ),
+        migrations.AddConstraint(
+            model_name='journalentryline',
+            constraint=models.CheckConstraint(check=models.Q(('debit', 0), ('credit', 0), _connector='OR'), name='jel_one_side_only'),
+        ),
+        migrations.AddConstraint(
+            model_name='journalentryline',
+            constraint=models.CheckConstraint(check=models.Q(('debit__gt', 0), ('credit__gt', 0), _connector='OR'), name='jel_nonzero'),
+        ),
+        migrations.RunSQL(ACCOUNT_BALANCES_VIEW, 'DROP VIEW account_balances'),
+    ]
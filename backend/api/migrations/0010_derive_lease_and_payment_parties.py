@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+
+def sync_parties(apps, schema_editor):
+    """Align stored properties and tenants with the unit and lease they come from"""
+    Unit = apps.get_model('api', 'Unit')
+    Lease = apps.get_model('api', 'Lease')
+    Payment = apps.get_model('api', 'Payment')
+    Lease.objects.update(
+        property=Subquery(Unit.objects.filter(pk=OuterRef('unit')).values('property')[:1])
+    )
+    leases = Lease.objects.filter(pk=OuterRef('lease'))
+    Payment.objects.update(
+        tenant=Subquery(leases.values('tenant')[:1]),
+        property=Subquery(leases.values('property')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_journal_line_one_side_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lease',
+            name='property',
+            field=models.ForeignKey(editable=False, help_text='Property being leased (taken from the unit)', on_delete=django.db.models.deletion.CASCADE, related_name='leases', to='api.property'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='property',
+            field=models.ForeignKey(editable=False, help_text='Property the payment is for (taken from the lease)', on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='api.property'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='tenant',
+            field=models.ForeignKey(editable=False, help_text='Tenant making the payment (taken from the lease)', on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='api.tenant'),
+        ),
+        migrations.RunPython(sync_parties, migrations.RunPython.noop),
+    ]
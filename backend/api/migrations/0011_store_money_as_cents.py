@@ -0,0 +1,109 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:47
+
+import api.fields
+from decimal import Decimal
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import F
+
+
+MONEY_FIELDS = [
+    ('account', 'balance'),
+    ('expense', 'amount'),
+    ('journalentryline', 'credit'),
+    ('journalentryline', 'debit'),
+    ('lease', 'monthly_rent'),
+    ('lease', 'security_deposit'),
+    ('payment', 'amount'),
+    ('unit', 'rent_amount'),
+]
+
+# Dropped while the columns change type: PostgreSQL cannot retype a column a
+# view reads from, and SQLite cannot rebuild a table a view depends on
+ACCOUNT_BALANCES_VIEW = """
+CREATE VIEW account_balances AS
+SELECT
+    a.id AS account_id,
+    COALESCE(SUM(l.debit), 0) AS total_debit,
+    COALESCE(SUM(l.credit), 0) AS total_credit,
+    COALESCE(SUM(l.debit), 0) - COALESCE(SUM(l.credit), 0) AS balance
+FROM api_account a
+LEFT JOIN api_journalentryline l ON l.account_id = a.id
+GROUP BY a.id
+"""
+
+
+def amounts_to_cents(apps, schema_editor):
+    for model_name, field_name in MONEY_FIELDS:
+        apps.get_model('api', model_name).objects.update(**{field_name: F(field_name) * 100})
+
+
+def cents_to_amounts(apps, schema_editor):
+    for model_name, field_name in MONEY_FIELDS:
+        apps.get_model('api', model_name).objects.update(**{field_name: F(field_name) / 100.0})
+
+
+def widened_fields():
+    """Widen each column first so multiplying by 100 cannot overflow it"""
+    return [
+        migrations.AlterField(
+            model_name=model_name,
+            name=field_name,
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=17),
+        )
+        for model_name, field_name in MONEY_FIELDS
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_derive_lease_and_payment_parties'),
+    ]
+
+    operations = [
+        migrations.RunSQL('DROP VIEW account_balances', ACCOUNT_BALANCES_VIEW),
+        *widened_fields(),
+        migrations.RunPython(amounts_to_cents, cents_to_amounts),
+        migrations.AlterField(
+            model_name='account',
+            name='balance',
+            field=api.fields.MoneyField(decimal_places=2, default=0, help_text='Current account balance', max_digits=15),
+        ),
+        migrations.AlterField(
+            model_name='expense',
+            name='amount',
+            field=api.fields.MoneyField(decimal_places=2, help_text='Expense amount', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+        migrations.AlterField(
+            model_name='journalentryline',
+            name='credit',
+            field=api.fields.MoneyField(decimal_places=2, default=0, help_text='Credit amount', max_digits=15, validators=[django.core.validators.MinValueValidator(Decimal('0'))]),
+        ),
+        migrations.AlterField(
+            model_name='journalentryline',
+            name='debit',
+            field=api.fields.MoneyField(decimal_places=2, default=0, help_text='Debit amount', max_digits=15, validators=[django.core.validators.MinValueValidator(Decimal('0'))]),
+        ),
+        migrations.AlterField(
+            model_name='lease',
+            name='monthly_rent',
+            field=api.fields.MoneyField(decimal_places=2, help_text='Monthly rent amount', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+        migrations.AlterField(
+            model_name='lease',
+            name='security_deposit',
+            field=api.fields.MoneyField(decimal_places=2, default=0, help_text='Security deposit amount', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0'))]),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='amount',
+            field=api.fields.MoneyField(decimal_places=2, help_text='Payment amount', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+        migrations.AlterField(
+            model_name='unit',
+            name='rent_amount',
+            field=api.fields.MoneyField(decimal_places=2, help_text='Monthly rent amount', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+        migrations.RunSQL(ACCOUNT_BALANCES_VIEW, 'DROP VIEW account_balances'),
+    ]
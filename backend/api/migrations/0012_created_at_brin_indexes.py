@@ -0,0 +1,47 @@
+"""
+BRIN indexes on the append-only created_at columns (PostgreSQL only)
+
+Rows in these tables are inserted in created_at order and never backdated,
+so a BRIN index (one summary per block range) serves date-range scans at a
+tiny fraction of a B-tree's size and insert cost. MySQL has no BRIN indexes;
+InnoDB already clusters these rows by their auto-increment key, which follows
+insertion order, so nothing is created there.
+"""
+from django.db import migrations
+
+
+BRIN_TABLES = ['api_payment', 'api_expense', 'api_notification', 'api_journalentryline']
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    for table in BRIN_TABLES:
+        schema_editor.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS %s ON %s USING BRIN (created_at) '
+            'WITH (pages_per_range = 128)' % (quote('%s_created_brin' % table), quote(table))
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    for table in BRIN_TABLES:
+        schema_editor.execute(
+            'DROP INDEX CONCURRENTLY IF EXISTS %s' % quote('%s_created_brin' % table)
+        )
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('api', '0011_store_money_as_cents'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
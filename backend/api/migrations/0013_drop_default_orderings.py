@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_created_at_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='account',
+            options={'verbose_name': 'Account', 'verbose_name_plural': 'Accounts'},
+        ),
+        migrations.AlterModelOptions(
+            name='document',
+            options={'verbose_name': 'Document', 'verbose_name_plural': 'Documents'},
+        ),
+        migrations.AlterModelOptions(
+            name='expense',
+            options={'verbose_name': 'Expense', 'verbose_name_plural': 'Expenses'},
+        ),
+        migrations.AlterModelOptions(
+            name='journalentry',
+            options={'verbose_name': 'Journal Entry', 'verbose_name_plural': 'Journal Entries'},
+        ),
+        migrations.AlterModelOptions(
+            name='lease',
+            options={'verbose_name': 'Lease', 'verbose_name_plural': 'Leases'},
+        ),
+        migrations.AlterModelOptions(
+            name='notification',
+            options={'verbose_name': 'Notification', 'verbose_name_plural': 'Notifications'},
+        ),
+        migrations.AlterModelOptions(
+            name='payment',
+            options={'verbose_name': 'Payment', 'verbose_name_plural': 'Payments'},
+        ),
+        migrations.AlterModelOptions(
+            name='property',
+            options={'verbose_name': 'Property', 'verbose_name_plural': 'Properties'},
+        ),
+        migrations.AlterModelOptions(
+            name='tenant',
+            options={'verbose_name': 'Tenant', 'verbose_name_plural': 'Tenants'},
+        ),
+        migrations.AlterModelOptions(
+            name='unit',
+            options={'verbose_name': 'Unit', 'verbose_name_plural': 'Units'},
+        ),
+        migrations.AlterModelOptions(
+            name='user',
+            options={'verbose_name': 'User', 'verbose_name_plural': 'Users'},
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+def keep_latest_primary_image(apps, schema_editor):
+    """Leave at most one primary image per property, the most recent one"""
+    PropertyImage = apps.get_model('api', 'PropertyImage')
+    seen = set()
+    demote = []
+    primaries = PropertyImage.objects.filter(is_primary=True).order_by('property_id', '-created_at', '-id')
+    for image_id, property_id in primaries.values_list('id', 'property_id'):
+        if property_id in seen:
+            demote.append(image_id)
+        seen.add(property_id)
+    PropertyImage.objects.filter(pk__in=demote).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_enum_choice_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_primary_image, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='propertyimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('property',), name='one_primary_image_per_property'),
+        ),
+    ]
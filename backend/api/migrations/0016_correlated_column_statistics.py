@@ -0,0 +1,69 @@
+"""
+Extended statistics on correlated column pairs
+
+The planner assumes columns are independent, so it under-estimates the rows
+matching filters like region + district or unit + status and can pick nested
+loops where a hash join would be cheaper. On PostgreSQL, CREATE STATISTICS
+records the functional dependencies (and n-distinct for the location pair)
+between these columns. MySQL 8.0 has no multi-column statistics; there a
+histogram on each column is the nearest equivalent. MariaDB and SQLite are
+left alone.
+"""
+from django.db import migrations
+
+
+# (statistics name, kinds, table, columns)
+STATISTICS = [
+    ('property_geo_stats', 'dependencies, ndistinct', 'api_property', ['region', 'district']),
+    ('unit_property_status_stats', 'dependencies', 'api_unit', ['property_id', 'status']),
+    ('payment_lease_status_stats', 'dependencies', 'api_payment', ['lease_id', 'status']),
+]
+
+
+def is_mysql8(connection):
+    return (
+        connection.vendor == 'mysql'
+        and not connection.mysql_is_mariadb
+        and connection.mysql_version >= (8, 0)
+    )
+
+
+def create_statistics(apps, schema_editor):
+    connection = schema_editor.connection
+    quote = schema_editor.quote_name
+    for name, kinds, table, columns in STATISTICS:
+        column_list = ', '.join(quote(column) for column in columns)
+        if connection.vendor == 'postgresql':
+            schema_editor.execute(
+                'CREATE STATISTICS IF NOT EXISTS %s (%s) ON %s FROM %s'
+                % (quote(name), kinds, column_list, quote(table))
+            )
+            schema_editor.execute('ANALYZE %s' % quote(table))
+        elif is_mysql8(connection):
+            schema_editor.execute(
+                'ANALYZE TABLE %s UPDATE HISTOGRAM ON %s' % (quote(table), column_list)
+            )
+
+
+def drop_statistics(apps, schema_editor):
+    connection = schema_editor.connection
+    quote = schema_editor.quote_name
+    for name, kinds, table, columns in STATISTICS:
+        column_list = ', '.join(quote(column) for column in columns)
+        if connection.vendor == 'postgresql':
+            schema_editor.execute('DROP STATISTICS IF EXISTS %s' % quote(name))
+        elif is_mysql8(connection):
+            schema_editor.execute(
+                'ANALYZE TABLE %s DROP HISTOGRAM ON %s' % (quote(table), column_list)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_one_primary_image_per_property'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_statistics, drop_statistics),
+    ]
@@ -0,0 +1,49 @@
+"""
+Trigram indexes for substring searches on names (PostgreSQL only)
+
+The API search filter compiles to UPPER(column) LIKE UPPER('%term%'), which
+a B-tree index cannot serve. pg_trgm GIN indexes on the same expression let
+PostgreSQL answer these searches from the index. MySQL cannot index a leading
+wildcard LIKE at all, so nothing is created there.
+"""
+from django.db import migrations
+
+
+# (table, column) pairs searched with icontains
+TRIGRAM_COLUMNS = [
+    ('api_property', 'name'),
+    ('api_property', 'street'),
+    ('api_user', 'username'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column in TRIGRAM_COLUMNS:
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s USING GIN (UPPER(%s) gin_trgm_ops)' % (
+                quote('%s_%s_trgm' % (table, column)), quote(table), quote(column)
+            )
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    for table, column in TRIGRAM_COLUMNS:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % quote('%s_%s_trgm' % (table, column)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_correlated_column_statistics'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
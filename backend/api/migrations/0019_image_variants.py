@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_property_soft_delete'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('width', models.PositiveIntegerField(help_text='Width in pixels')),
+                ('format', models.CharField(default='webp', help_text='Image format', max_length=10)),
+                ('file', models.ImageField(help_text='Resized image file', upload_to='property_images/variants/')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('image', models.ForeignKey(help_text='Original image this variant was made from', on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='api.propertyimage')),
+            ],
+            options={
+                'verbose_name': 'Image Variant',
+                'verbose_name_plural': 'Image Variants',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='imagevariant',
+            constraint=models.UniqueConstraint(fields=('image', 'width', 'format'), name='unique_image_variant'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:01
+
+import api.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=api.fields.EnumCharField(choices=[('admin', 'Admin'), ('landlord', 'Landlord'), ('tenant', 'Tenant')], db_index=True, default='tenant', help_text='User role determines access permissions', max_length=20),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_index_user_role'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='unit',
+            index=models.Index(fields=['property', 'status'], name='unit_property_status_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='property',
+            name='property_landlord_live_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['landlord', '-start_date'], name='lease_landlord_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['tenant', '-due_date'], name='payment_tenant_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['landlord', 'is_deleted', '-created_at'], name='property_landlord_live_idx'),
+        ),
+    ]
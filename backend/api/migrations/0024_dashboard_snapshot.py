@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:14
+
+import api.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_list_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_properties', models.PositiveIntegerField(default=0)),
+                ('total_units', models.PositiveIntegerField(default=0)),
+                ('total_tenants', models.PositiveIntegerField(default=0)),
+                ('total_leases', models.PositiveIntegerField(default=0)),
+                ('active_leases', models.PositiveIntegerField(default=0)),
+                ('total_payments', models.PositiveIntegerField(default=0)),
+                ('completed_payments', models.PositiveIntegerField(default=0)),
+                ('pending_payments', models.PositiveIntegerField(default=0)),
+                ('overdue_payments', models.PositiveIntegerField(default=0)),
+                ('total_revenue', api.fields.MoneyField(decimal_places=2, default=0, max_digits=17)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Dashboard Snapshot',
+                'verbose_name_plural': 'Dashboard Snapshots',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_dashboard_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['property', 'tenant'], name='lease_property_tenant_idx'),
+        ),
+    ]
@@ -8,6 +8,7 @@ Models included:
 - User: Custom user model with role-based access (Admin, Landlord, Tenant)
 - Property: Rental properties with details and location
 - PropertyImage: Multiple images for each property
+- ImageVariant: Resized WebP copies of property images
 - Unit: Individual units within a property
 - Tenant: Tenant profiles with contact info
 - Lease: Lease agreements linking tenants to units
@@ -17,12 +18,51 @@ Models included:
 - Notification: Communication system for tenants
 - Account: Chart of accounts for accounting
 - JournalEntry & JournalEntryLine: Double-entry bookkeeping system
+- DashboardSnapshot: Precomputed system-wide dashboard totals
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+from django.db.models.functions import Concat, Substr
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator
 from decimal import Decimal
+from functools import cached_property
+
+from .fields import EnumCharField, MoneyField
+
+
+class TimeStampedModel(models.Model):
+    """
+    Abstract base for models that record when rows are created and changed
+    """
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        abstract = True
+
+
+class CachedDisplayMixin:
+    """
+    Caches a model's string representation on the instance
+
+    Models whose ``__str__`` follows foreign keys define a ``_display``
+    cached_property instead, so the admin, logs and serializers that print the
+    same instance several times only build the string (and load the related
+    rows) once. The cached value is dropped on save() and refresh_from_db().
+    """
+
+    def __str__(self):
+        return self._display
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.__dict__.pop('_display', None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop('_display', None)
 
 
 # ==================== USER MODEL ====================
@@ -42,10 +82,11 @@ class User(AbstractUser):
     ]
     
     # Additional fields beyond Django's default User
-    role = models.CharField(
+    role = EnumCharField(
         max_length=20, 
         choices=ROLE_CHOICES, 
         default='tenant',
+        db_index=True,
         help_text="User role determines access permissions"
     )
     profile_picture = models.ImageField(
@@ -75,14 +116,38 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
-        ordering = ['-created_at']
     
     def __str__(self):
-        return f"{self.username} ({self.get_role_display()})"
+        return f"{self.username} ({ROLE_DISPLAY.get(self.role, self.role)})"
+
+
+ROLE_DISPLAY = dict(User.ROLE_CHOICES)
 
 
 # ==================== PROPERTY MODEL ====================
-class Property(models.Model):
+class PropertyQuerySet(models.QuerySet):
+    """
+    QuerySet whose delete() only marks properties as deleted
+
+    Deleting a property used to cascade through its units, leases, payments
+    and notifications in one statement. Soft deletion is a single UPDATE; the
+    purge_deleted_properties command removes the rows for good later on.
+    """
+
+    def delete(self):
+        return self.update(is_deleted=True, deleted_at=timezone.now())
+
+
+class ActivePropertyManager(models.Manager.from_queryset(PropertyQuerySet)):
+    """
+    Default Property manager that hides soft-deleted properties
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
+class Property(TimeStampedModel):
     """
     Property Model
     
@@ -116,7 +181,7 @@ class Property(models.Model):
     
     # Basic information
     name = models.CharField(max_length=200, help_text="Property name or title")
-    property_type = models.CharField(
+    property_type = EnumCharField(
         max_length=20, 
         choices=PROPERTY_TYPE_CHOICES,
         help_text="Type of property"
@@ -164,28 +229,48 @@ class Property(models.Model):
         blank=True,
         help_text="Payment terms and conditions"
     )
-    status = models.CharField(
+    status = EnumCharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
         default='vacant',
         help_text="Current property status"
     )
     
-    # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    # Soft deletion
+    is_deleted = models.BooleanField(default=False, editable=False)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
+    objects = ActivePropertyManager()
+    all_objects = models.Manager()
     
     class Meta:
         verbose_name = 'Property'
         verbose_name_plural = 'Properties'
-        ordering = ['-created_at']
+        indexes = [
+            # A landlord's live properties, newest first as the API lists them
+            models.Index(fields=['landlord', 'is_deleted', '-created_at'], name='property_landlord_live_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.street}"
+    
+    def delete(self, using=None, keep_parents=False):
+        """
+        Mark the property as deleted instead of removing it
+        
+        Its units, leases and payments are kept until the property is purged.
+        Use hard_delete() to remove it and everything under it right away.
+        """
+        self.is_deleted = True
+        self.deleted_at = timezone.now()
+        self.save(update_fields=['is_deleted', 'deleted_at'])
+    
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
 
 
 # ==================== PROPERTY IMAGE MODEL ====================
-class PropertyImage(models.Model):
+class PropertyImage(CachedDisplayMixin, models.Model):
     """
     Property Image Model
     
@@ -219,13 +304,74 @@ class PropertyImage(models.Model):
         verbose_name = 'Property Image'
         verbose_name_plural = 'Property Images'
         ordering = ['-is_primary', '-created_at']
+        constraints = [
+            # Enforced by the database where partial indexes exist (not MySQL),
+            # and by save() everywhere
+            models.UniqueConstraint(
+                fields=['property'],
+                condition=models.Q(is_primary=True),
+                name='one_primary_image_per_property',
+            ),
+        ]
+    
+    @cached_property
+    def _display(self):
+        return f"Image for {self.property.name}"
+    
+    def save(self, *args, **kwargs):
+        """
+        Make this image the only primary image of its property
+        """
+        with transaction.atomic():
+            if self.is_primary:
+                PropertyImage.objects.filter(
+                    property_id=self.property_id, is_primary=True
+                ).exclude(pk=self.pk).update(is_primary=False)
+            super().save(*args, **kwargs)
+
+
+class ImageVariant(models.Model):
+    """
+    Image Variant Model
+    
+    A resized WebP copy of a property image. Variants are generated after
+    the image is uploaded (see signals.py) so galleries and listings can load
+    a file close to the size they display instead of the full upload.
+    """
+    
+    # Widths generated for every uploaded image (smaller than the original)
+    WIDTHS = [256, 1024, 2048]
+    
+    image = models.ForeignKey(
+        PropertyImage,
+        on_delete=models.CASCADE,
+        related_name='variants',
+        help_text="Original image this variant was made from"
+    )
+    width = models.PositiveIntegerField(help_text="Width in pixels")
+    format = models.CharField(max_length=10, default='webp', help_text="Image format")
+    file = models.ImageField(
+        upload_to='property_images/variants/',
+        help_text="Resized image file"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = 'Image Variant'
+        verbose_name_plural = 'Image Variants'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['image', 'width', 'format'],
+                name='unique_image_variant',
+            ),
+        ]
     
     def __str__(self):
-        return f"Image for {self.property.name}"
+        return f"{self.width}px {self.format} variant of image {self.image_id}"
 
 
 # ==================== UNIT MODEL ====================
-class Unit(models.Model):
+class Unit(CachedDisplayMixin, TimeStampedModel):
     """
     Unit Model
     
@@ -266,13 +412,12 @@ class Unit(models.Model):
         validators=[MinValueValidator(0)],
         help_text="Number of bathrooms in this unit"
     )
-    rent_amount = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
+    rent_amount = MoneyField(
+        max_digits=10,
         validators=[MinValueValidator(Decimal('0.01'))],
         help_text="Monthly rent amount"
     )
-    status = models.CharField(
+    status = EnumCharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
         default='available',
@@ -283,22 +428,23 @@ class Unit(models.Model):
         blank=True,
         help_text="Unit description and amenities"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = 'Unit'
         verbose_name_plural = 'Units'
-        ordering = ['property', 'unit_number']
         # Ensure unit numbers are unique within a property
         unique_together = ['property', 'unit_number']
+        indexes = [
+            models.Index(fields=['property', 'status'], name='unit_property_status_idx'),
+        ]
     
-    def __str__(self):
+    @cached_property
+    def _display(self):
         return f"{self.property.name} - Unit {self.unit_number}"
 
 
 # ==================== TENANT MODEL ====================
-class Tenant(models.Model):
+class Tenant(CachedDisplayMixin, TimeStampedModel):
     """
     Tenant Model
     
@@ -333,6 +479,7 @@ class Tenant(models.Model):
         max_length=100, 
         null=True, 
         blank=True,
+        db_index=True,
         help_text="ID number"
     )
     
@@ -375,20 +522,17 @@ class Tenant(models.Model):
         help_text="Additional notes about the tenant"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Tenant'
         verbose_name_plural = 'Tenants'
-        ordering = ['-created_at']
     
-    def __str__(self):
+    @cached_property
+    def _display(self):
         return f"{self.user.get_full_name() or self.user.username}"
 
 
 # ==================== LEASE MODEL ====================
-class Lease(models.Model):
+class Lease(CachedDisplayMixin, TimeStampedModel):
     """
     Lease Model
     
@@ -408,7 +552,8 @@ class Lease(models.Model):
         Property, 
         on_delete=models.CASCADE, 
         related_name='leases',
-        help_text="Property being leased"
+        editable=False,
+        help_text="Property being leased (taken from the unit)"
     )
     unit = models.ForeignKey(
         Unit, 
@@ -433,21 +578,19 @@ class Lease(models.Model):
     # Lease details
     start_date = models.DateField(help_text="Lease start date")
     end_date = models.DateField(help_text="Lease end date")
-    monthly_rent = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
+    monthly_rent = MoneyField(
+        max_digits=10,
         validators=[MinValueValidator(Decimal('0.01'))],
         help_text="Monthly rent amount"
     )
-    security_deposit = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
+    security_deposit = MoneyField(
+        max_digits=10,
         default=0,
         validators=[MinValueValidator(Decimal('0'))],
         help_text="Security deposit amount"
     )
     
-    status = models.CharField(
+    status = EnumCharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
         default='pending',
@@ -467,20 +610,32 @@ class Lease(models.Model):
         help_text="Additional lease terms and notes"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Lease'
         verbose_name_plural = 'Leases'
-        ordering = ['-start_date']
-    
-    def __str__(self):
+        indexes = [
+            models.Index(fields=['status'], name='lease_status_idx'),
+            models.Index(fields=['unit', 'status', '-start_date'], name='lease_unit_status_start_idx'),
+            models.Index(fields=['landlord', '-start_date'], name='lease_landlord_start_idx'),
+            # Tenant visibility checks: does this tenant lease this property?
+            models.Index(fields=['property', 'tenant'], name='lease_property_tenant_idx'),
+        ]
+    
+    @cached_property
+    def _display(self):
         return f"Lease: {self.property.name} - {self.unit.unit_number} - {self.tenant}"
+    
+    def save(self, *args, **kwargs):
+        """
+        Keep the property in step with the leased unit
+        """
+        if self.unit_id:
+            self.property_id = self.unit.property_id
+        super().save(*args, **kwargs)
 
 
 # ==================== PAYMENT MODEL ====================
-class Payment(models.Model):
+class Payment(CachedDisplayMixin, TimeStampedModel):
     """
     Payment Model
     
@@ -510,13 +665,15 @@ class Payment(models.Model):
         Tenant, 
         on_delete=models.CASCADE, 
         related_name='payments',
-        help_text="Tenant making the payment"
+        editable=False,
+        help_text="Tenant making the payment (taken from the lease)"
     )
     property = models.ForeignKey(
         Property, 
         on_delete=models.CASCADE, 
         related_name='payments',
-        help_text="Property the payment is for"
+        editable=False,
+        help_text="Property the payment is for (taken from the lease)"
     )
     lease = models.ForeignKey(
         Lease, 
@@ -526,13 +683,12 @@ class Payment(models.Model):
     )
     
     # Payment details
-    amount = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
+    amount = MoneyField(
+        max_digits=10,
         validators=[MinValueValidator(Decimal('0.01'))],
         help_text="Payment amount"
     )
-    payment_method = models.CharField(
+    payment_method = EnumCharField(
         max_length=20, 
         choices=METHOD_CHOICES,
         help_text="How the payment was made"
@@ -541,6 +697,7 @@ class Payment(models.Model):
         max_length=200, 
         null=True, 
         blank=True,
+        db_index=True,
         help_text="Transaction reference number"
     )
     
@@ -551,7 +708,7 @@ class Payment(models.Model):
         blank=True,
         help_text="Actual payment date"
     )
-    status = models.CharField(
+    status = EnumCharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
         default='pending',
@@ -571,20 +728,34 @@ class Payment(models.Model):
         help_text="Payment notes"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Payment'
         verbose_name_plural = 'Payments'
-        ordering = ['-due_date']
-    
-    def __str__(self):
+        indexes = [
+            models.Index(fields=['status', 'due_date'], name='payment_status_due_idx'),
+            models.Index(fields=['lease', 'status', '-due_date'], name='payment_lease_status_due_idx'),
+            models.Index(fields=['tenant', '-paid_date'], name='payment_tenant_paid_idx'),
+            models.Index(fields=['tenant', '-due_date'], name='payment_tenant_due_idx'),
+            # Newest payments first, as the dashboard lists them
+            models.Index(fields=['-created_at'], name='payment_created_idx'),
+        ]
+    
+    @cached_property
+    def _display(self):
         return f"Payment: {self.tenant} - {self.amount} - {self.status}"
+    
+    def save(self, *args, **kwargs):
+        """
+        Keep the tenant and property in step with the lease
+        """
+        if self.lease_id:
+            self.tenant_id = self.lease.tenant_id
+            self.property_id = self.lease.property_id
+        super().save(*args, **kwargs)
 
 
 # ==================== EXPENSE MODEL ====================
-class Expense(models.Model):
+class Expense(CachedDisplayMixin, TimeStampedModel):
     """
     Expense Model
     
@@ -618,14 +789,13 @@ class Expense(models.Model):
         blank=True,
         help_text="Detailed description"
     )
-    category = models.CharField(
+    category = EnumCharField(
         max_length=20, 
         choices=CATEGORY_CHOICES,
         help_text="Expense category"
     )
-    amount = models.DecimalField(
-        max_digits=10, 
-        decimal_places=2,
+    amount = MoneyField(
+        max_digits=10,
         validators=[MinValueValidator(Decimal('0.01'))],
         help_text="Expense amount"
     )
@@ -639,20 +809,20 @@ class Expense(models.Model):
         help_text="Receipt or invoice"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Expense'
         verbose_name_plural = 'Expenses'
-        ordering = ['-date']
+        indexes = [
+            models.Index(fields=['property', '-date'], name='expense_property_date_idx'),
+        ]
     
-    def __str__(self):
+    @cached_property
+    def _display(self):
         return f"{self.title} - {self.property.name} - {self.amount}"
 
 
 # ==================== DOCUMENT MODEL ====================
-class Document(models.Model):
+class Document(TimeStampedModel):
     """
     Document Model
     
@@ -705,7 +875,7 @@ class Document(models.Model):
         upload_to='documents/',
         help_text="Uploaded file"
     )
-    file_type = models.CharField(
+    file_type = EnumCharField(
         max_length=20, 
         choices=TYPE_CHOICES,
         help_text="Type of document"
@@ -724,20 +894,16 @@ class Document(models.Model):
         help_text="User who uploaded this document"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Document'
         verbose_name_plural = 'Documents'
-        ordering = ['-created_at']
     
     def __str__(self):
         return self.title
 
 
 # ==================== NOTIFICATION MODEL ====================
-class Notification(models.Model):
+class Notification(TimeStampedModel):
     """
     Notification Model
     
@@ -777,12 +943,12 @@ class Notification(models.Model):
         related_name='notifications',
         help_text="Associated lease"
     )
-    category = models.CharField(
+    category = EnumCharField(
         max_length=20, 
         choices=CATEGORY_CHOICES,
         help_text="Notification category"
     )
-    priority = models.CharField(
+    priority = EnumCharField(
         max_length=10, 
         choices=PRIORITY_CHOICES, 
         default='medium',
@@ -794,7 +960,7 @@ class Notification(models.Model):
     )
     description = models.TextField(help_text="Detailed description")
     
-    status = models.CharField(
+    status = EnumCharField(
         max_length=20, 
         choices=STATUS_CHOICES, 
         default='pending',
@@ -821,20 +987,21 @@ class Notification(models.Model):
         help_text="User who responded"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'priority'], name='notification_status_prio_idx'),
+            models.Index(fields=['lease', 'status', '-created_at'], name='notif_lease_status_created_idx'),
+            models.Index(fields=['-created_at'], name='notification_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.subject} - {self.status}"
 
 
 # ==================== ACCOUNTING MODELS ====================
-class Account(models.Model):
+class Account(TimeStampedModel):
     """
     Account Model
     
@@ -860,7 +1027,7 @@ class Account(models.Model):
         max_length=200,
         help_text="Account name"
     )
-    account_type = models.CharField(
+    account_type = EnumCharField(
         max_length=20, 
         choices=TYPE_CHOICES,
         help_text="Type of account"
@@ -870,9 +1037,8 @@ class Account(models.Model):
         blank=True,
         help_text="Account description"
     )
-    balance = models.DecimalField(
-        max_digits=15, 
-        decimal_places=2, 
+    balance = MoneyField(
+        max_digits=15,
         default=0,
         help_text="Current account balance"
     )
@@ -885,25 +1051,59 @@ class Account(models.Model):
         related_name='sub_accounts',
         help_text="Parent account for hierarchy"
     )
+    path = models.CharField(
+        max_length=255,
+        db_index=True,
+        editable=False,
+        default='',
+        help_text="Materialized path of account ids from the root, e.g. /1/4/9/"
+    )
     
     is_active = models.BooleanField(
         default=True,
         help_text="Is this account active?"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Account'
         verbose_name_plural = 'Accounts'
-        ordering = ['code']
     
     def __str__(self):
         return f"{self.code} - {self.name}"
+    
+    def save(self, *args, **kwargs):
+        """
+        Save the account and keep its path, and its sub-accounts' paths, in step
+        with the parent account
+        """
+        old_path = self.path
+        super().save(*args, **kwargs)
+        
+        parent_path = '/'
+        if self.parent_account_id:
+            parent_path = Account.objects.filter(
+                pk=self.parent_account_id
+            ).values_list('path', flat=True).first() or '/'
+        path = f'{parent_path}{self.pk}/'
+        if path == old_path:
+            return
+        
+        Account.objects.filter(pk=self.pk).update(path=path)
+        if old_path:
+            # Re-root the whole subtree in a single statement
+            Account.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                path=Concat(models.Value(path), Substr('path', len(old_path) + 1))
+            )
+        self.path = path
+    
+    def get_descendants(self):
+        """
+        All accounts below this one in the hierarchy, at any depth
+        """
+        return Account.objects.filter(path__startswith=self.path).exclude(pk=self.pk)
 
 
-class JournalEntry(models.Model):
+class JournalEntry(TimeStampedModel):
     """
     Journal Entry Model
     
@@ -927,19 +1127,15 @@ class JournalEntry(models.Model):
         help_text="User who created this entry"
     )
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    
     class Meta:
         verbose_name = 'Journal Entry'
         verbose_name_plural = 'Journal Entries'
-        ordering = ['-entry_date']
     
     def __str__(self):
         return f"Entry {self.id} - {self.entry_date}"
 
 
-class JournalEntryLine(models.Model):
+class JournalEntryLine(CachedDisplayMixin, models.Model):
     """
     Journal Entry Line Model
     
@@ -960,16 +1156,14 @@ class JournalEntryLine(models.Model):
         help_text="Account being debited or credited"
     )
     
-    debit = models.DecimalField(
-        max_digits=15, 
-        decimal_places=2, 
+    debit = MoneyField(
+        max_digits=15,
         default=0,
         validators=[MinValueValidator(Decimal('0'))],
         help_text="Debit amount"
     )
-    credit = models.DecimalField(
-        max_digits=15, 
-        decimal_places=2, 
+    credit = MoneyField(
+        max_digits=15,
         default=0,
         validators=[MinValueValidator(Decimal('0'))],
         help_text="Credit amount"
@@ -986,6 +1180,85 @@ class JournalEntryLine(models.Model):
     class Meta:
         verbose_name = 'Journal Entry Line'
         verbose_name_plural = 'Journal Entry Lines'
+        indexes = [
+            models.Index(fields=['account', 'journal_entry'], name='jel_account_entry_idx'),
+            # Partial indexes are skipped on MySQL, which does not support them
+            models.Index(fields=['journal_entry'], condition=models.Q(debit__gt=0), name='jel_debits'),
+            models.Index(fields=['journal_entry'], condition=models.Q(credit__gt=0), name='jel_credits'),
+        ]
+        constraints = [
+            # A line either debits or credits its account, never both or neither
+            models.CheckConstraint(
+                check=models.Q(debit=0) | models.Q(credit=0), name='jel_one_side_only'
+            ),
+            models.CheckConstraint(
+                check=models.Q(debit__gt=0) | models.Q(credit__gt=0), name='jel_nonzero'
+            ),
+        ]
+    
+    @cached_property
+    def _display(self):
+        return f"{self.account.name} - Dr: {self.debit}, Cr: {self.credit}"
+
+
+class AccountBalance(models.Model):
+    """
+    Account Balance Model
+    
+    Read-only ledger totals per account, backed by the ``account_balances``
+    database view over journal entry lines. Balances are summed by the
+    database when read, so posting journal lines never updates Account rows.
+    """
+    
+    account = models.OneToOneField(
+        Account,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='ledger_balance',
+        help_text="Account these totals belong to"
+    )
+    total_debit = MoneyField(max_digits=17)
+    total_credit = MoneyField(max_digits=17)
+    balance = MoneyField(
+        max_digits=17,
+        help_text="Total debits minus total credits"
+    )
+    
+    class Meta:
+        managed = False
+        db_table = 'account_balances'
+        verbose_name = 'Account Balance'
+        verbose_name_plural = 'Account Balances'
     
     def __str__(self):
-        return f"{self.account.name} - Dr: {self.debit}, Cr: {self.credit}"
+        return f"{self.account_id} - {self.balance}"
+
+
+class DashboardSnapshot(models.Model):
+    """
+    Dashboard Snapshot Model
+    
+    System-wide totals for the admin dashboard. Counting and summing every
+    row is the part of the dashboard that grows with the tables, so the
+    refresh_dashboard_snapshot command (run from cron) stores the figures in
+    a single row and the dashboard reads them while they are recent.
+    """
+    
+    total_properties = models.PositiveIntegerField(default=0)
+    total_units = models.PositiveIntegerField(default=0)
+    total_tenants = models.PositiveIntegerField(default=0)
+    total_leases = models.PositiveIntegerField(default=0)
+    active_leases = models.PositiveIntegerField(default=0)
+    total_payments = models.PositiveIntegerField(default=0)
+    completed_payments = models.PositiveIntegerField(default=0)
+    pending_payments = models.PositiveIntegerField(default=0)
+    overdue_payments = models.PositiveIntegerField(default=0)
+    total_revenue = MoneyField(max_digits=17, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Dashboard Snapshot'
+        verbose_name_plural = 'Dashboard Snapshots'
+    
+    def __str__(self):
+        return f"Dashboard totals at {self.updated_at}"
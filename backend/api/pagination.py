@@ -0,0 +1,84 @@
+"""
+Pagination Helpers for Rental Management System
+
+This file defines paginators that avoid exact COUNT(*) queries on large tables.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+def estimated_row_count(model, using='default'):
+    """
+    Return the database's own row estimate for a model's table
+
+    Reads the statistics MySQL (information_schema) and PostgreSQL
+    (pg_class.reltuples) keep for every table. Returns None on other
+    databases or when no estimate is available.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == 'mysql':
+        sql = (
+            'SELECT TABLE_ROWS FROM information_schema.TABLES '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s'
+        )
+    elif connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)'
+    else:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class LargeTablePaginator(Paginator):
+    """
+    Paginator that estimates the size of large unfiltered tables
+
+    Counting every row of a big table is slow on both MySQL (InnoDB) and
+    PostgreSQL. When the queryset has no filters and the table statistics
+    report more than ``estimate_threshold`` rows, that estimate is used as the
+    count. Filtered querysets and small tables are still counted exactly.
+    """
+    estimate_threshold = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        # A UNION has no WHERE of its own but is filtered in its branches
+        if query is not None and not query.where and not query.combinator:
+            estimate = estimated_row_count(queryset.model, using=queryset.db)
+            if estimate is not None and estimate > self.estimate_threshold:
+                return estimate
+        return super().count
+
+
+class LargeTablePagination(PageNumberPagination):
+    """
+    Page number pagination for the API that estimates large table sizes
+
+    Same responses as PageNumberPagination, but the count of an unfiltered
+    large table comes from LargeTablePaginator's estimate, so listing it
+    does not scan the whole table.
+    """
+    django_paginator_class = LargeTablePaginator
+
+
+class LedgerCursorPagination(CursorPagination):
+    """
+    Cursor pagination in id order for append-only ledger rows
+
+    Pages are fetched with WHERE id > last seen id on the primary key, so
+    reading far into the ledger costs the same as the first page and no
+    COUNT(*) is run. Clients follow the next/previous links instead of
+    asking for page numbers.
+    """
+    ordering = 'id'
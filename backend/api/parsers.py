@@ -0,0 +1,28 @@
+"""
+Request Parsers for Rental Management System
+
+This file defines how request bodies are turned into Python data.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser backed by orjson
+
+    orjson decodes the raw UTF-8 body in one call instead of going through
+    a text reader. Like DRF's strict mode it rejects NaN and Infinity.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
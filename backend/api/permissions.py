@@ -7,6 +7,14 @@ Different user roles (Admin, Landlord, Tenant) have different permissions.
 
 from rest_framework import permissions
 
+# User.role values checked by the permission classes below
+ADMIN = 'admin'
+LANDLORD = 'landlord'
+TENANT = 'tenant'
+ADMIN_OR_LANDLORD = frozenset({ADMIN, LANDLORD})
+
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
 
 class IsAdmin(permissions.BasePermission):
     """
@@ -19,7 +27,7 @@ class IsAdmin(permissions.BasePermission):
         """
         Check if user is authenticated and has admin role
         """
-        return request.user and request.user.is_authenticated and request.user.role == 'admin'
+        return request.user and request.user.is_authenticated and request.user.role == ADMIN
 
 
 class IsLandlord(permissions.BasePermission):
@@ -33,7 +41,7 @@ class IsLandlord(permissions.BasePermission):
         """
         Check if user is authenticated and has landlord role
         """
-        return request.user and request.user.is_authenticated and request.user.role == 'landlord'
+        return request.user and request.user.is_authenticated and request.user.role == LANDLORD
 
 
 class IsTenant(permissions.BasePermission):
@@ -47,7 +55,7 @@ class IsTenant(permissions.BasePermission):
         """
         Check if user is authenticated and has tenant role
         """
-        return request.user and request.user.is_authenticated and request.user.role == 'tenant'
+        return request.user and request.user.is_authenticated and request.user.role == TENANT
 
 
 class IsAdminOrLandlord(permissions.BasePermission):
@@ -64,7 +72,7 @@ class IsAdminOrLandlord(permissions.BasePermission):
         return (
             request.user 
             and request.user.is_authenticated 
-            and request.user.role in ['admin', 'landlord']
+            and request.user.role in ADMIN_OR_LANDLORD
         )
 
 
@@ -81,16 +89,19 @@ class IsOwnerOrAdmin(permissions.BasePermission):
         Check if user is admin or the owner of the object
         """
         # Admin can access everything
-        if request.user.role == 'admin':
+        if request.user.role == ADMIN:
             return True
         
+        # Compare the foreign key ids rather than the related objects, so
+        # checking ownership never loads the landlord or user row
+        
         # Check if object has a landlord field
-        if hasattr(obj, 'landlord'):
-            return obj.landlord == request.user
+        if hasattr(obj, 'landlord_id'):
+            return obj.landlord_id == request.user.pk
         
         # Check if object has a user field
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == request.user.pk
         
         return False
 
@@ -102,8 +113,9 @@ class ReadOnly(permissions.BasePermission):
     Allows GET, HEAD, OPTIONS requests only.
     """
     
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         """
         Allow read-only methods for authenticated users
         """
-        return request.method in permissions.SAFE_METHODS
+        return request.method in SAFE_METHODS
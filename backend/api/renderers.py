@@ -0,0 +1,34 @@
+"""
+Response Renderers for Rental Management System
+
+This file defines how API responses are turned into bytes.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson
+
+    orjson encodes in C and produces compact UTF-8 output directly. Values
+    it cannot encode itself (Decimal, lazy strings, datetimes and the like)
+    go through DRF's JSONEncoder. U+2028 and U+2029 are escaped as DRF does,
+    so the output is safe to embed in a script tag. Floats can be written
+    differently (1e16 rather than 1e+16). Requests that ask for indented
+    output are rendered by DRF's JSONRenderer.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        # Same escaping as JSONRenderer: these are valid in JSON but end a
+        # line in JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -9,16 +9,55 @@ This file contains serializers for all models in the system.
 
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import cached_property
 from .models import (
-    Property, PropertyImage, Unit, Tenant, Lease, Payment,
+    Property, PropertyImage, ImageVariant, Unit, Tenant, Lease, Payment,
     Expense, Document, Notification, Account, JournalEntry, JournalEntryLine
 )
 
 User = get_user_model()
 
 
+class AnnotatedCharField(serializers.CharField):
+    """
+    Read-only value taken from a queryset annotation named like the field
+    
+    The viewsets annotate display names (e.g. tenant_name) in SQL. Instances
+    loaded without the annotation, such as the one returned after a create,
+    or after an update (see FreshAnnotationsMixin in views.py), fall back to
+    resolving ``source`` on the related objects.
+    """
+    
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def get_attribute(self, instance):
+        try:
+            return instance.__dict__[self.field_name]
+        except KeyError:
+            return super().get_attribute(instance)
+
+
+class ReadableFieldsMixin:
+    """
+    Work out a serializer's readable fields once instead of once per object
+    
+    DRF filters out the write-only fields again for every object it
+    serializes. Listing many rows reuses one serializer instance, so the
+    filtered list is kept on it.
+    """
+    
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
+
 # ==================== USER SERIALIZERS ====================
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for User model
     
@@ -31,11 +70,11 @@ class UserSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id', 'username', 'email', 'first_name', 'last_name',
             'role', 'phone', 'profile_picture', 'password',
             'must_change_password', 'last_login_at', 'created_at'
-        ]
+        )
         extra_kwargs = {
             'password': {'write_only': True},
         }
@@ -57,8 +96,20 @@ class UserSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         Update user, handling password hashing if password is being changed
+        
+        Plain field changes are written with a single UPDATE of just those
+        columns. Password changes and picture uploads go through save(),
+        which hashes the password and stores the file.
         """
         password = validated_data.pop('password', None)
+        if not password and 'profile_picture' not in validated_data:
+            if validated_data:
+                validated_data['updated_at'] = timezone.now()
+                User.objects.filter(pk=instance.pk).update(**validated_data)
+                for attr, value in validated_data.items():
+                    setattr(instance, attr, value)
+            return instance
+        
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
@@ -69,6 +120,17 @@ class UserSerializer(serializers.ModelSerializer):
         return instance
 
 
+class UserMiniSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact read-only user representation for nesting in other serializers
+    """
+    
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'first_name', 'last_name', 'email')
+        read_only_fields = fields
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer specifically for user registration
@@ -80,16 +142,19 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = User
-        fields = [
+        fields = (
             'username', 'email', 'password', 'password2',
             'first_name', 'last_name', 'role', 'phone'
-        ]
+        )
     
     def validate(self, attrs):
         """
         Validate that passwords match
+        
+        The confirmation is dropped once checked; only password is saved.
         """
-        if attrs['password'] != attrs['password2']:
+        password2 = attrs.pop('password2')
+        if not constant_time_compare(attrs['password'], password2):
             raise serializers.ValidationError({
                 "password": "Password fields didn't match."
             })
@@ -97,9 +162,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         """
-        Create user after removing password2 field
+        Create user with a hashed password
         """
-        validated_data.pop('password2')
         password = validated_data.pop('password')
         user = User.objects.create(**validated_data)
         user.set_password(password)
@@ -108,20 +172,35 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
 
 # ==================== PROPERTY SERIALIZERS ====================
-class PropertyImageSerializer(serializers.ModelSerializer):
+class ImageVariantSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for ImageVariant model
+    
+    Resized copies of a property image, for building srcset attributes.
+    """
+    
+    class Meta:
+        model = ImageVariant
+        fields = ('width', 'format', 'file')
+
+
+class PropertyImageSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for PropertyImage model
     
     Handles image uploads for properties.
+    Lists the resized variants once they have been generated.
     """
     
+    variants = ImageVariantSerializer(many=True, read_only=True)
+    
     class Meta:
         model = PropertyImage
-        fields = ['id', 'property', 'image', 'caption', 'is_primary', 'created_at']
-        read_only_fields = ['created_at']
+        fields = ('id', 'property', 'image', 'variants', 'caption', 'is_primary', 'created_at')
+        read_only_fields = ('created_at',)
 
 
-class PropertySerializer(serializers.ModelSerializer):
+class PropertySerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Property model
     
@@ -130,106 +209,124 @@ class PropertySerializer(serializers.ModelSerializer):
     
     # Nested serializers for related data
     images = PropertyImageSerializer(many=True, read_only=True)
-    landlord_name = serializers.CharField(source='landlord.get_full_name', read_only=True)
+    landlord_name = AnnotatedCharField(source='landlord.get_full_name')
     
     class Meta:
         model = Property
-        fields = [
+        fields = (
             'id', 'landlord', 'landlord_name', 'name', 'property_type',
             'description', 'region', 'district', 'ward', 'street',
             'bedrooms', 'bathrooms', 'area_sqft', 'payment_terms',
             'status', 'images', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
+        # The landlord lookup is limited to landlord users by the model field's
+        # limit_choices_to, so any other user is rejected as not found
+        extra_kwargs = {
+            'landlord': {'error_messages': {
+                'does_not_exist': 'Selected user must have landlord role.'
+            }},
+        }
+
+
+class PropertyListSerializer(PropertySerializer):
+    """
+    Serializer for property listings
     
-    def validate(self, attrs):
-        """
-        Validate property data
-        """
-        # Ensure landlord has landlord role
-        if 'landlord' in attrs and attrs['landlord'].role != 'landlord':
-            raise serializers.ValidationError({
-                "landlord": "Selected user must have landlord role."
-            })
-        return attrs
+    Replaces the nested images with the URL of the image a listing card
+    shows (the primary image, else the newest), which the list queryset
+    selects with a subquery.
+    """
+    
+    images = None
+    primary_image = serializers.SerializerMethodField()
+    
+    class Meta(PropertySerializer.Meta):
+        fields = tuple(
+            field for field in PropertySerializer.Meta.fields if field != 'images'
+        ) + ('primary_image',)
+    
+    def get_primary_image(self, obj):
+        name = getattr(obj, 'primary_image', None)
+        if not name:
+            return None
+        url = PropertyImage._meta.get_field('image').storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
 
 
 # ==================== UNIT SERIALIZERS ====================
-class UnitSerializer(serializers.ModelSerializer):
+class UnitSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Unit model
     
     Represents individual rental units within properties.
     """
     
-    property_name = serializers.CharField(source='property.name', read_only=True)
+    property_name = AnnotatedCharField(source='property.name')
     
     class Meta:
         model = Unit
-        fields = [
+        fields = (
             'id', 'property', 'property_name', 'unit_number', 'floor',
             'bedrooms', 'bathrooms', 'rent_amount', 'status',
             'description', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 
 # ==================== TENANT SERIALIZERS ====================
-class TenantSerializer(serializers.ModelSerializer):
+class TenantSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Tenant model
     
     Includes user information and tenant-specific details.
     """
     
-    user_details = UserSerializer(source='user', read_only=True)
-    tenant_name = serializers.CharField(source='user.get_full_name', read_only=True)
+    user_details = UserMiniSerializer(source='user', read_only=True)
+    tenant_name = AnnotatedCharField(source='user.get_full_name')
     
     class Meta:
         model = Tenant
-        fields = [
+        fields = (
             'id', 'user', 'user_details', 'tenant_name', 'phone',
             'alternative_phone', 'identification_type', 'identification_number',
             'emergency_contact_name', 'emergency_contact_phone',
             'emergency_contact_relationship', 'occupation', 'employer',
             'notes', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
-    
-    def validate(self, attrs):
-        """
-        Validate tenant data
-        """
-        # Ensure user has tenant role
-        if 'user' in attrs and attrs['user'].role != 'tenant':
-            raise serializers.ValidationError({
-                "user": "Selected user must have tenant role."
-            })
-        return attrs
+        )
+        read_only_fields = ('created_at', 'updated_at')
+        # The user lookup is limited to tenant users by the model field's
+        # limit_choices_to, so any other user is rejected as not found
+        extra_kwargs = {
+            'user': {'error_messages': {
+                'does_not_exist': 'Selected user must have tenant role.'
+            }},
+        }
 
 
 # ==================== LEASE SERIALIZERS ====================
-class LeaseSerializer(serializers.ModelSerializer):
+class LeaseSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Lease model
     
     Links tenants to units with lease terms.
     """
     
-    property_name = serializers.CharField(source='property.name', read_only=True)
-    unit_number = serializers.CharField(source='unit.unit_number', read_only=True)
-    tenant_name = serializers.CharField(source='tenant.user.get_full_name', read_only=True)
-    landlord_name = serializers.CharField(source='landlord.get_full_name', read_only=True)
+    property_name = AnnotatedCharField(source='property.name')
+    unit_number = AnnotatedCharField(source='unit.unit_number')
+    tenant_name = AnnotatedCharField(source='tenant.user.get_full_name')
+    landlord_name = AnnotatedCharField(source='landlord.get_full_name')
     
     class Meta:
         model = Lease
-        fields = [
+        fields = (
             'id', 'property', 'property_name', 'unit', 'unit_number',
             'tenant', 'tenant_name', 'landlord', 'landlord_name',
             'start_date', 'end_date', 'monthly_rent', 'security_deposit',
             'status', 'document', 'notes', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
     def validate(self, attrs):
         """
@@ -242,37 +339,37 @@ class LeaseSerializer(serializers.ModelSerializer):
                     "end_date": "End date must be after start date."
                 })
         
-        # Ensure unit belongs to the property
-        if 'property' in attrs and 'unit' in attrs:
-            if attrs['unit'].property != attrs['property']:
-                raise serializers.ValidationError({
-                    "unit": "Selected unit does not belong to the selected property."
-                })
-        
         return attrs
 
 
 # ==================== PAYMENT SERIALIZERS ====================
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Payment model
     
     Tracks rent payments and other financial transactions.
     """
     
-    tenant_name = serializers.CharField(source='tenant.user.get_full_name', read_only=True)
-    property_name = serializers.CharField(source='property.name', read_only=True)
-    lease_info = serializers.CharField(source='lease.__str__', read_only=True)
+    tenant_name = AnnotatedCharField(source='tenant.user.get_full_name')
+    property_name = AnnotatedCharField(source='property.name')
+    lease_info = serializers.SerializerMethodField()
     
     class Meta:
         model = Payment
-        fields = [
+        fields = (
             'id', 'tenant', 'tenant_name', 'property', 'property_name',
             'lease', 'lease_info', 'amount', 'payment_method',
             'transaction_id', 'due_date', 'paid_date', 'status',
             'proof_document', 'notes', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
+    
+    def get_lease_info(self, obj):
+        """
+        Lease label, from the viewset's lease_info annotation when present
+        """
+        annotated = getattr(obj, 'lease_info', None)
+        return annotated if annotated is not None else str(obj.lease)
     
     def validate(self, attrs):
         """
@@ -288,121 +385,182 @@ class PaymentSerializer(serializers.ModelSerializer):
 
 
 # ==================== EXPENSE SERIALIZERS ====================
-class ExpenseSerializer(serializers.ModelSerializer):
+class ExpenseSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Expense model
     
     Tracks property-related expenses.
     """
     
-    property_name = serializers.CharField(source='property.name', read_only=True)
+    property_name = AnnotatedCharField(source='property.name')
     
     class Meta:
         model = Expense
-        fields = [
+        fields = (
             'id', 'property', 'property_name', 'title', 'description',
             'category', 'amount', 'date', 'receipt',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 
 # ==================== DOCUMENT SERIALIZERS ====================
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Document model
     
     General document management for various file types.
     """
     
-    uploaded_by_name = serializers.CharField(source='uploaded_by.get_full_name', read_only=True)
+    uploaded_by_name = AnnotatedCharField(source='uploaded_by.get_full_name')
     
     class Meta:
         model = Document
-        fields = [
+        fields = (
             'id', 'lease', 'user', 'property', 'title', 'file',
             'file_type', 'description', 'uploaded_by', 'uploaded_by_name',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at', 'uploaded_by']
+        )
+        read_only_fields = ('created_at', 'updated_at', 'uploaded_by')
 
 
 # ==================== NOTIFICATION SERIALIZERS ====================
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Notification model
     
     Communication system for tenants and landlords.
     """
     
-    lease_info = serializers.CharField(source='lease.__str__', read_only=True)
-    responded_by_name = serializers.CharField(source='responded_by.get_full_name', read_only=True)
+    lease_info = serializers.SerializerMethodField()
+    responded_by_name = AnnotatedCharField(source='responded_by.get_full_name')
     
     class Meta:
         model = Notification
-        fields = [
+        fields = (
             'id', 'lease', 'lease_info', 'category', 'priority',
             'subject', 'description', 'status', 'landlord_response',
             'responded_at', 'responded_by', 'responded_by_name',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
+    
+    def get_lease_info(self, obj):
+        """
+        Lease label, from the viewset's lease_info annotation when present
+        """
+        annotated = getattr(obj, 'lease_info', None)
+        return annotated if annotated is not None else str(obj.lease)
 
 
 # ==================== ACCOUNTING SERIALIZERS ====================
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Account model
     
     Chart of accounts for financial tracking.
     """
     
-    parent_account_name = serializers.CharField(source='parent_account.name', read_only=True)
+    parent_account_name = AnnotatedCharField(source='parent_account.name')
+    ledger_balance = serializers.DecimalField(
+        source='ledger_balance.balance', max_digits=17, decimal_places=2, read_only=True
+    )
     
     class Meta:
         model = Account
-        fields = [
+        fields = (
             'id', 'code', 'name', 'account_type', 'description',
-            'balance', 'parent_account', 'parent_account_name',
+            'balance', 'ledger_balance', 'parent_account', 'parent_account_name',
             'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 
-class JournalEntryLineSerializer(serializers.ModelSerializer):
+class JournalEntryLineSerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for JournalEntryLine model
     
     Individual debit/credit lines in a journal entry.
     """
     
-    account_name = serializers.CharField(source='account.name', read_only=True)
+    account_name = AnnotatedCharField(source='account.name')
     
     class Meta:
         model = JournalEntryLine
-        fields = [
+        fields = (
             'id', 'journal_entry', 'account', 'account_name',
             'debit', 'credit', 'description', 'created_at'
-        ]
-        read_only_fields = ['created_at']
+        )
+        read_only_fields = ('created_at',)
+    
+    def validate(self, attrs):
+        """
+        Mirror the database constraint: exactly one of debit or credit is set
+        """
+        debit = attrs.get('debit', getattr(self.instance, 'debit', 0))
+        credit = attrs.get('credit', getattr(self.instance, 'credit', 0))
+        if (debit > 0) == (credit > 0):
+            raise serializers.ValidationError('A line must have either a debit or a credit amount, not both.')
+        return attrs
+
+
+class NestedJournalEntryLineSerializer(JournalEntryLineSerializer):
+    """
+    Journal entry line written as part of its entry
+    
+    The entry is assigned by JournalEntrySerializer, so it is not expected
+    in the submitted line data.
+    """
+    
+    class Meta(JournalEntryLineSerializer.Meta):
+        read_only_fields = ('journal_entry', 'created_at')
 
 
-class JournalEntrySerializer(serializers.ModelSerializer):
+class JournalEntrySerializer(ReadableFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for JournalEntry model
     
     Journal entries for double-entry bookkeeping.
-    Includes nested lines for debits and credits.
+    Includes nested lines for debits and credits. Lines can be posted together
+    with the entry and are inserted in a single bulk query.
     """
     
-    lines = JournalEntryLineSerializer(many=True, read_only=True)
-    created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
+    lines = NestedJournalEntryLineSerializer(many=True, required=False)
+    created_by_name = AnnotatedCharField(source='created_by.get_full_name')
     
     class Meta:
         model = JournalEntry
-        fields = [
+        fields = (
             'id', 'entry_date', 'description', 'reference',
             'created_by', 'created_by_name', 'lines',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at', 'created_by']
+        )
+        read_only_fields = ('created_at', 'updated_at', 'created_by')
+    
+    def create(self, validated_data):
+        """
+        Create the entry, then insert all of its lines at once
+        """
+        lines_data = validated_data.pop('lines', [])
+        with transaction.atomic():
+            entry = super().create(validated_data)
+            self._create_lines(entry, lines_data)
+        return entry
+    
+    def update(self, instance, validated_data):
+        """
+        Update the entry; submitted lines replace the existing ones
+        """
+        lines_data = validated_data.pop('lines', None)
+        with transaction.atomic():
+            entry = super().update(instance, validated_data)
+            if lines_data is not None:
+                entry.lines.all().delete()
+                self._create_lines(entry, lines_data)
+        return entry
+    
+    def _create_lines(self, entry, lines_data):
+        JournalEntryLine.objects.bulk_create(
+            [JournalEntryLine(journal_entry=entry, **line) for line in lines_data],
+            batch_size=500,
+        )
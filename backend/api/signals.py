@@ -0,0 +1,75 @@
+"""
+Signal Handlers for Rental Management System
+
+Connected in ApiConfig.ready().
+"""
+
+import logging
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .caching import clear_account_chart, clear_dashboard_stats
+from .images import generate_image_variants
+from .models import Account, Lease, Notification, Payment, Property, PropertyImage, Tenant, Unit
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_variants(image_id):
+    property_image = PropertyImage.objects.filter(pk=image_id).first()
+    if property_image is None or not property_image.image:
+        return
+    try:
+        generate_image_variants(property_image)
+    except Exception:
+        # A broken upload must not fail the request that saved it; the
+        # original image is still served
+        logger.exception('Could not generate variants for property image %s', image_id)
+
+
+@receiver(pre_save, sender=PropertyImage)
+def note_new_image_file(sender, instance, **kwargs):
+    """
+    Remember whether this save stores a newly uploaded file
+
+    A file assigned from an upload is not committed to storage until the
+    model is saved, so editing only the caption or primary flag is skipped.
+    """
+    instance._image_uploaded = bool(instance.image) and not instance.image._committed
+
+
+@receiver(post_save, sender=PropertyImage)
+def queue_image_variants(sender, instance, **kwargs):
+    """
+    Build resized variants once a newly uploaded image has been committed
+    """
+    if getattr(instance, '_image_uploaded', False):
+        instance._image_uploaded = False
+        transaction.on_commit(partial(_generate_variants, instance.pk))
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_chart(sender, **kwargs):
+    """
+    Drop the cached chart of accounts once the change is committed
+    """
+    transaction.on_commit(clear_account_chart)
+
+
+DASHBOARD_MODELS = [Property, Unit, Tenant, Lease, Payment, Notification]
+
+
+def invalidate_dashboard_stats(sender, **kwargs):
+    """
+    Drop cached dashboard statistics once a change they count is committed
+    """
+    transaction.on_commit(clear_dashboard_stats)
+
+
+for model in DASHBOARD_MODELS:
+    post_save.connect(invalidate_dashboard_stats, sender=model)
+    post_delete.connect(invalidate_dashboard_stats, sender=model)
@@ -0,0 +1,249 @@
+"""
+Tests for the Rental Management System API
+
+Run with: python manage.py test api
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Property, Unit, Tenant, Lease, Payment, Document, Notification
+from .renderers import ORJSONRenderer
+
+User = get_user_model()
+
+
+class RentalAPITestCase(APITestCase):
+    """
+    Base test case with a landlord, two properties with a unit each and two
+    tenants, one of them leasing the first unit
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='site_admin', password='pw', role='admin')
+        cls.landlord = User.objects.create_user(
+            username='landlord', password='pw', role='landlord',
+            first_name='John', last_name='Smith',
+        )
+        cls.property = cls.create_property('Sunset Apartments')
+        cls.other_property = cls.create_property('Green Valley Homes')
+        cls.unit = Unit.objects.create(
+            property=cls.property, unit_number='A1', rent_amount=Decimal('500.00')
+        )
+        cls.other_unit = Unit.objects.create(
+            property=cls.other_property, unit_number='B1', rent_amount=Decimal('650.00')
+        )
+        cls.tenant_user = User.objects.create_user(
+            username='tenant', password='pw', role='tenant',
+            first_name='Alice', last_name='Johnson',
+        )
+        cls.tenant = Tenant.objects.create(user=cls.tenant_user, phone='555-0100')
+        cls.other_tenant_user = User.objects.create_user(
+            username='tenant2', password='pw', role='tenant',
+            first_name='Bob', last_name='Williams',
+        )
+        cls.other_tenant = Tenant.objects.create(user=cls.other_tenant_user, phone='555-0101')
+        cls.lease = Lease.objects.create(
+            property=cls.property, unit=cls.unit, tenant=cls.tenant, landlord=cls.landlord,
+            start_date=date(2026, 1, 1), end_date=date(2026, 12, 31),
+            monthly_rent=Decimal('500.00'), status='active',
+        )
+
+    @classmethod
+    def create_property(cls, name):
+        return Property.objects.create(
+            landlord=cls.landlord, name=name, property_type='residential',
+            region='Region', district='District', street=f'{name} Street',
+        )
+
+
+class UpdateDisplayNamesTests(RentalAPITestCase):
+    """
+    Updates return display names for the saved relations, not the old ones
+    """
+
+    def setUp(self):
+        self.client.force_authenticate(self.landlord)
+
+    def test_lease_tenant_name_follows_new_tenant(self):
+        response = self.client.patch(
+            f'/api/leases/{self.lease.pk}/', {'tenant': self.other_tenant.pk}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tenant_name'], 'Bob Williams')
+
+    def test_unit_property_name_follows_new_property(self):
+        response = self.client.patch(
+            f'/api/units/{self.unit.pk}/', {'property': self.other_property.pk}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['property_name'], 'Green Valley Homes')
+
+
+class NotificationRespondTests(RentalAPITestCase):
+    """
+    Responding to a notification returns the responder's name
+    """
+
+    def test_respond_returns_responder_name(self):
+        notification = Notification.objects.create(
+            lease=self.lease, category='maintenance', subject='Leaking tap',
+            description='The kitchen tap is leaking.',
+        )
+        self.client.force_authenticate(self.landlord)
+        response = self.client.post(
+            f'/api/notifications/{notification.pk}/respond/',
+            {'response': 'A plumber will come on Monday.'}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['responded_by'], self.landlord.pk)
+        self.assertEqual(response.data['responded_by_name'], 'John Smith')
+
+
+class SoftDeletedPropertyTests(RentalAPITestCase):
+    """
+    Rows under a soft-deleted property disappear from lists and dashboards
+    """
+
+    def setUp(self):
+        cache.clear()
+        other_lease = Lease.objects.create(
+            property=self.other_property, unit=self.other_unit, tenant=self.other_tenant,
+            landlord=self.landlord, start_date=date(2026, 1, 1), end_date=date(2026, 12, 31),
+            monthly_rent=Decimal('650.00'), status='active',
+        )
+        Payment.objects.create(
+            tenant=self.other_tenant, property=self.other_property, lease=other_lease,
+            amount=Decimal('650.00'), payment_method='cash', due_date=date(2026, 1, 1),
+        )
+        Notification.objects.create(
+            lease=other_lease, category='inquiry', subject='Parking', description='Is there parking?',
+        )
+        self.client.force_authenticate(self.landlord)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'/api/properties/{self.other_property.pk}/')
+        self.assertEqual(response.status_code, 204)
+
+    def test_lists_leave_out_deleted_property(self):
+        expected = {'properties': 1, 'units': 1, 'leases': 1, 'payments': 0, 'notifications': 0}
+        for endpoint, count in expected.items():
+            with self.subTest(endpoint=endpoint):
+                response = self.client.get(f'/api/{endpoint}/')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['count'], count)
+
+    def test_dashboard_counts_leave_out_deleted_property(self):
+        stats = self.client.get('/api/dashboard/stats/').data
+        self.assertEqual(stats['total_properties'], 1)
+        self.assertEqual(stats['total_units'], 1)
+        self.assertEqual(stats['active_leases'], 1)
+        self.assertEqual(stats['total_tenants'], 1)
+        self.assertEqual(stats['total_payments'], 0)
+
+        self.client.force_authenticate(self.admin)
+        stats = self.client.get('/api/dashboard/stats/').data
+        self.assertEqual(stats['total_properties'], 1)
+        self.assertEqual(stats['total_units'], 1)
+        self.assertEqual(stats['total_leases'], 1)
+        self.assertEqual(stats['total_payments'], 0)
+
+
+class DocumentListTests(RentalAPITestCase):
+    """
+    Users see documents of their own and documents they uploaded, once each
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.property_doc = cls.create_document('Title deed', property=cls.property)
+        cls.both_doc = cls.create_document('Floor plan', property=cls.property, uploaded_by=cls.landlord)
+        cls.uploaded_doc = cls.create_document('Tenant ID', user=cls.tenant_user, uploaded_by=cls.landlord)
+        cls.tenant_doc = cls.create_document('Payslip', user=cls.tenant_user, uploaded_by=cls.tenant_user)
+        cls.create_document('Other ID', user=cls.other_tenant_user, uploaded_by=cls.other_tenant_user)
+
+    @classmethod
+    def create_document(cls, title, **fields):
+        return Document.objects.create(title=title, file='documents/doc.pdf', file_type='other', **fields)
+
+    def list_ids(self, query=''):
+        response = self.client.get(f'/api/documents/{query}')
+        self.assertEqual(response.status_code, 200)
+        return [document['id'] for document in response.data['results']]
+
+    def test_landlord_sees_property_and_uploaded_documents(self):
+        self.client.force_authenticate(self.landlord)
+        self.assertEqual(
+            self.list_ids(),
+            [self.uploaded_doc.pk, self.both_doc.pk, self.property_doc.pk],
+        )
+        self.assertEqual(
+            self.list_ids('?ordering=created_at&search=i'),
+            [self.property_doc.pk, self.uploaded_doc.pk],
+        )
+
+    def test_tenant_sees_own_documents(self):
+        self.client.force_authenticate(self.tenant_user)
+        self.assertEqual(self.list_ids(), [self.tenant_doc.pk, self.uploaded_doc.pk])
+        response = self.client.get(f'/api/documents/{self.property_doc.pk}/')
+        self.assertEqual(response.status_code, 404)
+
+
+class JWTAuthenticationTests(RentalAPITestCase):
+    """
+    Token authentication loads a tenant's profile with the user
+    """
+
+    def test_tenant_user_loaded_in_one_query(self):
+        token = AccessToken.for_user(self.tenant_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/auth/user/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['username'], 'tenant')
+        self.assertEqual(len(queries), 1)
+        self.assertIn('api_tenant', queries[0]['sql'])
+
+    def test_inactive_user_rejected(self):
+        token = AccessToken.for_user(self.tenant_user)
+        User.objects.filter(pk=self.tenant_user.pk).update(is_active=False)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        response = self.client.get('/api/auth/user/')
+        self.assertEqual(response.status_code, 401)
+
+
+class TenantDashboardTests(RentalAPITestCase):
+    """
+    The tenant dashboard shows the latest of several active leases
+    """
+
+    def test_active_lease_is_latest(self):
+        cache.clear()
+        renewal = Lease.objects.create(
+            property=self.property, unit=self.unit, tenant=self.tenant, landlord=self.landlord,
+            start_date=date(2027, 1, 1), end_date=date(2027, 12, 31),
+            monthly_rent=Decimal('550.00'), status='active',
+        )
+        Lease.objects.filter(pk=self.lease.pk).update(start_date=date(2025, 1, 1))
+        self.client.force_authenticate(self.tenant_user)
+        stats = self.client.get('/api/dashboard/stats/').data
+        self.assertEqual(stats['active_lease']['id'], renewal.pk)
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    The orjson renderer escapes line separators like DRF's renderer
+    """
+
+    def test_line_separators_escaped(self):
+        rendered = ORJSONRenderer().render({'description': 'one\u2028two\u2029three'})
+        self.assertEqual(rendered, b'{"description":"one\\u2028two\\u2029three"}')
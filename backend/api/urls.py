@@ -4,12 +4,12 @@ URL Configuration for API
 This file defines all the URL patterns for the API endpoints.
 It routes incoming HTTP requests to the appropriate views.
 
-The API uses Django REST Framework's DefaultRouter which automatically
+The API uses Django REST Framework's SimpleRouter which automatically
 generates URL patterns for ViewSets (list, create, retrieve, update, delete).
 """
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -39,8 +39,10 @@ from .views import (
 )
 
 # Create a router and register our viewsets with it
-# The router automatically generates URL patterns for us
-router = DefaultRouter()
+# The router automatically generates URL patterns for us. SimpleRouter skips
+# the browsable API root view and the .json/.api suffix patterns, which the
+# frontend never requests, so every request matches against fewer patterns.
+router = SimpleRouter()
 
 # Register all viewsets
 # This creates endpoints like /api/properties/, /api/properties/{id}/, etc.
@@ -19,24 +19,97 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Sum, Q
+from django.core.cache import cache
+from django.db.models import (
+    Case, CharField, Count, Exists, F, OuterRef, Prefetch, Subquery, Q, Value, When
+)
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from django.utils import timezone
 from datetime import timedelta
+from functools import partial, reduce
+import operator
 
 from .models import (
     Property, PropertyImage, Unit, Tenant, Lease, Payment,
     Expense, Document, Notification, Account, JournalEntry, JournalEntryLine
 )
 from .serializers import (
-    UserSerializer, UserRegistrationSerializer, PropertySerializer,
+    UserSerializer, UserRegistrationSerializer, PropertySerializer, PropertyListSerializer,
     PropertyImageSerializer, UnitSerializer, TenantSerializer, LeaseSerializer,
     PaymentSerializer, ExpenseSerializer, DocumentSerializer, NotificationSerializer,
     AccountSerializer, JournalEntrySerializer, JournalEntryLineSerializer
 )
+from .caching import DASHBOARD_STATS_TIMEOUT, dashboard_stats_key
+from .dashboard import payment_summary, system_totals
+from .filters import (
+    UserFilter, PropertyFilter, UnitFilter, TenantFilter, LeaseFilter, PaymentFilter,
+    ExpenseFilter, DocumentFilter, NotificationFilter, AccountFilter,
+    JournalEntryFilter, JournalEntryLineFilter
+)
+from .pagination import LedgerCursorPagination
 from .permissions import IsAdmin, IsLandlord, IsTenant, IsAdminOrLandlord, IsOwnerOrAdmin
 
 User = get_user_model()
 
+def full_name(prefix):
+    """
+    User.get_full_name() for the user at ``prefix``, as a database expression
+    """
+    return Trim(Concat(
+        f'{prefix}first_name', Value(' '), f'{prefix}last_name', output_field=CharField()
+    ))
+
+
+def optional_full_name(relation):
+    """
+    full_name() of a nullable user relation, NULL when it is not set
+    """
+    return Case(
+        When(**{f'{relation}__isnull': True}, then=Value(None)),
+        default=full_name(f'{relation}__'),
+        output_field=CharField(),
+    )
+
+
+# Display names read by the serializers, computed by the database instead of
+# loading the related rows (see AnnotatedCharField in serializers.py)
+def lease_names():
+    return {
+        'property_name': F('property__name'),
+        'unit_number': F('unit__unit_number'),
+        'tenant_name': full_name('tenant__user__'),
+        'landlord_name': full_name('landlord__'),
+    }
+
+
+def payment_names():
+    return {
+        'tenant_name': full_name('tenant__user__'),
+        'property_name': F('property__name'),
+    }
+
+
+def notification_names():
+    return {'responded_by_name': optional_full_name('responded_by')}
+
+
+def with_lease_info(queryset):
+    """
+    Annotate rows with their lease's label, built the same way as Lease.__str__
+
+    The serializers' lease_info reads this instead of loading each lease and
+    the property, unit and tenant its __str__ follows.
+    """
+    tenant_name = Trim(Concat(
+        'lease__tenant__user__first_name', Value(' '), 'lease__tenant__user__last_name'
+    ))
+    return queryset.annotate(lease_info=Concat(
+        Value('Lease: '), 'lease__property__name',
+        Value(' - '), 'lease__unit__unit_number',
+        Value(' - '), Coalesce(NullIf(tenant_name, Value('')), 'lease__tenant__user__username'),
+        output_field=CharField(),
+    ))
+
 
 # ==================== AUTHENTICATION VIEWS ====================
 
@@ -101,6 +174,71 @@ def update_user_profile(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+# ==================== ROLE SCOPING ====================
+
+class RoleScopedMixin:
+    """
+    Limit a viewset's queryset to the rows the requesting user may see
+    
+    Each role's rows are described by a lookup path instead of a branch in
+    every get_queryset():
+    - Admins see everything
+    - Landlords see rows where ``landlord_lookup`` is themselves
+    - Tenants see rows where ``tenant_lookup`` is their tenant profile
+    - Other users, and roles without a lookup, see nothing
+    
+    Rows tenants reach through one of their leases set ``tenant_lease_link``
+    to a (lease field, own field) pair instead, e.g. ('property', 'pk') for
+    properties. They are matched with an EXISTS subquery on leases, which
+    needs no join over every lease and no DISTINCT.
+    """
+    landlord_lookup = None
+    tenant_lookup = None
+    tenant_lease_link = None
+    
+    def role_filter(self, user):
+        """
+        Return a condition (Q or Exists) selecting the user's rows, or None
+        for no rows
+        """
+        if user.role == 'admin':
+            return Q()
+        if user.role == 'landlord' and self.landlord_lookup:
+            return Q(**{self.landlord_lookup: user})
+        if user.role == 'tenant':
+            tenant_profile = getattr(user, 'tenant_profile', None)
+            if tenant_profile and self.tenant_lookup:
+                return Q(**{self.tenant_lookup: tenant_profile})
+            if tenant_profile and self.tenant_lease_link:
+                lease_field, field = self.tenant_lease_link
+                return Exists(Lease.objects.filter(
+                    tenant=tenant_profile, **{lease_field: OuterRef(field)}
+                ))
+        return None
+    
+    def filter_by_role(self, queryset):
+        condition = self.role_filter(self.request.user)
+        if condition is None:
+            return queryset.none()
+        return queryset.filter(condition)
+
+
+class FreshAnnotationsMixin:
+    """
+    Drop a viewset's queryset annotations from an object once it is updated
+    
+    Display names such as tenant_name are annotated by get_queryset() and
+    read by AnnotatedCharField. An update returns the object get_object()
+    loaded, whose annotations still describe the old relations, so they are
+    removed and the response follows the saved relations instead.
+    """
+    
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        for name in self.get_queryset().query.annotations:
+            serializer.instance.__dict__.pop(name, None)
+
+
 # ==================== USER VIEWSET ====================
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -114,14 +252,28 @@ class UserViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['role', 'is_active']
+    filterset_class = UserFilter
     search_fields = ['username', 'email', 'first_name', 'last_name']
     ordering_fields = ['created_at', 'username']
+    ordering = ['-created_at']
+    
+    def get_queryset(self):
+        """
+        Read only the columns the serializer returns when listing or
+        showing users, leaving out the password hash and the unused
+        AbstractUser flags.
+        """
+        queryset = super().get_queryset()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.only(*(
+                field for field in UserSerializer.Meta.fields if field != 'password'
+            ))
+        return queryset
 
 
 # ==================== PROPERTY VIEWSET ====================
 
-class PropertyViewSet(viewsets.ModelViewSet):
+class PropertyViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Property model
     
@@ -132,9 +284,20 @@ class PropertyViewSet(viewsets.ModelViewSet):
     serializer_class = PropertySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['property_type', 'status', 'landlord', 'region', 'district']
+    filterset_class = PropertyFilter
     search_fields = ['name', 'description', 'street', 'region', 'district']
     ordering_fields = ['created_at', 'name']
+    ordering = ['-created_at']
+    landlord_lookup = 'landlord'
+    tenant_lease_link = ('property', 'pk')
+    
+    def get_serializer_class(self):
+        """
+        Listings show one image per property instead of the full gallery.
+        """
+        if self.action == 'list':
+            return PropertyListSerializer
+        return PropertySerializer
     
     def get_queryset(self):
         """
@@ -144,20 +307,15 @@ class PropertyViewSet(viewsets.ModelViewSet):
         - Landlords see only their properties
         - Tenants see properties they're leasing
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Property.objects.all()
-        elif user.role == 'landlord':
-            return Property.objects.filter(landlord=user)
-        elif user.role == 'tenant':
-            # Get properties where tenant has an active lease
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return Property.objects.filter(
-                    leases__tenant=tenant_profile
-                ).distinct()
-            return Property.objects.none()
-        return Property.objects.none()
+        queryset = Property.objects.annotate(landlord_name=full_name('landlord__'))
+        if self.action == 'list':
+            queryset = queryset.annotate(primary_image=Subquery(
+                PropertyImage.objects.filter(property=OuterRef('pk'))
+                .order_by('-is_primary', '-created_at').values('image')[:1]
+            ))
+        else:
+            queryset = queryset.prefetch_related('images__variants')
+        return self.filter_by_role(queryset)
     
     def perform_create(self, serializer):
         """
@@ -171,7 +329,7 @@ class PropertyViewSet(viewsets.ModelViewSet):
 
 # ==================== PROPERTY IMAGE VIEWSET ====================
 
-class PropertyImageViewSet(viewsets.ModelViewSet):
+class PropertyImageViewSet(RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for PropertyImage model
     
@@ -179,29 +337,21 @@ class PropertyImageViewSet(viewsets.ModelViewSet):
     """
     serializer_class = PropertyImageSerializer
     permission_classes = [IsAuthenticated]
+    landlord_lookup = 'property__landlord'
+    tenant_lease_link = ('property', 'property')
     
     def get_queryset(self):
         """
         Filter images based on user role and property access.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return PropertyImage.objects.all()
-        elif user.role == 'landlord':
-            return PropertyImage.objects.filter(property__landlord=user)
-        elif user.role == 'tenant':
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return PropertyImage.objects.filter(
-                    property__leases__tenant=tenant_profile
-                ).distinct()
-            return PropertyImage.objects.none()
-        return PropertyImage.objects.none()
+        return self.filter_by_role(
+            PropertyImage.objects.prefetch_related('variants').filter(property__is_deleted=False)
+        )
 
 
 # ==================== UNIT VIEWSET ====================
 
-class UnitViewSet(viewsets.ModelViewSet):
+class UnitViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Unit model
     
@@ -210,32 +360,26 @@ class UnitViewSet(viewsets.ModelViewSet):
     serializer_class = UnitSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['property', 'status', 'floor']
+    filterset_class = UnitFilter
     search_fields = ['unit_number', 'description']
     ordering_fields = ['created_at', 'unit_number', 'rent_amount']
+    ordering = ['property', 'unit_number']
+    landlord_lookup = 'property__landlord'
+    tenant_lease_link = ('property', 'property')
     
     def get_queryset(self):
         """
         Filter units based on user role and property access.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Unit.objects.all()
-        elif user.role == 'landlord':
-            return Unit.objects.filter(property__landlord=user)
-        elif user.role == 'tenant':
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return Unit.objects.filter(
-                    property__leases__tenant=tenant_profile
-                ).distinct()
-            return Unit.objects.none()
-        return Unit.objects.none()
+        return self.filter_by_role(
+            Unit.objects.annotate(property_name=F('property__name'))
+            .filter(property__is_deleted=False)
+        )
 
 
 # ==================== TENANT VIEWSET ====================
 
-class TenantViewSet(viewsets.ModelViewSet):
+class TenantViewSet(RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Tenant model
     
@@ -244,9 +388,10 @@ class TenantViewSet(viewsets.ModelViewSet):
     serializer_class = TenantSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['user']
+    filterset_class = TenantFilter
     search_fields = ['user__username', 'user__email', 'user__first_name', 'user__last_name', 'phone']
     ordering_fields = ['created_at']
+    ordering = ['-created_at']
     
     def get_queryset(self):
         """
@@ -256,21 +401,21 @@ class TenantViewSet(viewsets.ModelViewSet):
         - Landlords see tenants leasing their properties
         - Tenants see only their own profile
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Tenant.objects.all()
-        elif user.role == 'landlord':
-            return Tenant.objects.filter(
-                leases__property__landlord=user
-            ).distinct()
-        elif user.role == 'tenant':
-            return Tenant.objects.filter(user=user)
-        return Tenant.objects.none()
+        return self.filter_by_role(Tenant.objects.select_related('user'))
+    
+    def role_filter(self, user):
+        if user.role == 'landlord':
+            return Exists(Lease.objects.filter(
+                tenant=OuterRef('pk'), property__landlord=user, property__is_deleted=False
+            ))
+        if user.role == 'tenant':
+            return Q(user=user)
+        return super().role_filter(user)
 
 
 # ==================== LEASE VIEWSET ====================
 
-class LeaseViewSet(viewsets.ModelViewSet):
+class LeaseViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Lease model
     
@@ -279,30 +424,25 @@ class LeaseViewSet(viewsets.ModelViewSet):
     serializer_class = LeaseSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['property', 'unit', 'tenant', 'landlord', 'status']
+    filterset_class = LeaseFilter
     search_fields = ['property__name', 'unit__unit_number', 'tenant__user__username']
     ordering_fields = ['created_at', 'start_date', 'end_date']
+    ordering = ['-start_date']
+    landlord_lookup = 'landlord'
+    tenant_lookup = 'tenant'
     
     def get_queryset(self):
         """
         Filter leases based on user role.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Lease.objects.all()
-        elif user.role == 'landlord':
-            return Lease.objects.filter(landlord=user)
-        elif user.role == 'tenant':
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return Lease.objects.filter(tenant=tenant_profile)
-            return Lease.objects.none()
-        return Lease.objects.none()
+        return self.filter_by_role(
+            Lease.objects.annotate(**lease_names()).filter(property__is_deleted=False)
+        )
 
 
 # ==================== PAYMENT VIEWSET ====================
 
-class PaymentViewSet(viewsets.ModelViewSet):
+class PaymentViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Payment model
     
@@ -311,30 +451,26 @@ class PaymentViewSet(viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['tenant', 'property', 'lease', 'status', 'payment_method']
+    filterset_class = PaymentFilter
     search_fields = ['transaction_id', 'tenant__user__username']
     ordering_fields = ['created_at', 'due_date', 'paid_date', 'amount']
+    ordering = ['-due_date']
+    landlord_lookup = 'property__landlord'
+    tenant_lookup = 'tenant'
     
     def get_queryset(self):
         """
         Filter payments based on user role.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Payment.objects.all()
-        elif user.role == 'landlord':
-            return Payment.objects.filter(property__landlord=user)
-        elif user.role == 'tenant':
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return Payment.objects.filter(tenant=tenant_profile)
-            return Payment.objects.none()
-        return Payment.objects.none()
+        return self.filter_by_role(
+            with_lease_info(Payment.objects.annotate(**payment_names()))
+            .filter(property__is_deleted=False)
+        )
 
 
 # ==================== EXPENSE VIEWSET ====================
 
-class ExpenseViewSet(viewsets.ModelViewSet):
+class ExpenseViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Expense model
     
@@ -343,25 +479,25 @@ class ExpenseViewSet(viewsets.ModelViewSet):
     serializer_class = ExpenseSerializer
     permission_classes = [IsAuthenticated, IsAdminOrLandlord]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['property', 'category']
+    filterset_class = ExpenseFilter
     search_fields = ['title', 'description']
     ordering_fields = ['created_at', 'date', 'amount']
+    ordering = ['-date']
+    landlord_lookup = 'property__landlord'
     
     def get_queryset(self):
         """
         Filter expenses based on user role.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Expense.objects.all()
-        elif user.role == 'landlord':
-            return Expense.objects.filter(property__landlord=user)
-        return Expense.objects.none()
+        return self.filter_by_role(
+            Expense.objects.annotate(property_name=F('property__name'))
+            .filter(property__is_deleted=False)
+        )
 
 
 # ==================== DOCUMENT VIEWSET ====================
 
-class DocumentViewSet(viewsets.ModelViewSet):
+class DocumentViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Document model
     
@@ -370,26 +506,78 @@ class DocumentViewSet(viewsets.ModelViewSet):
     serializer_class = DocumentSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['file_type', 'lease', 'user', 'property']
+    filterset_class = DocumentFilter
     search_fields = ['title', 'description']
     ordering_fields = ['created_at']
+    ordering = ['-created_at']
+    
+    def document_queryset(self):
+        """
+        All documents, with the uploader's name and without those of deleted
+        properties (the property and lease are optional)
+        """
+        return (
+            Document.objects.annotate(uploaded_by_name=optional_full_name('uploaded_by'))
+            .exclude(property__is_deleted=True)
+            .exclude(lease__property__is_deleted=True)
+        )
     
     def get_queryset(self):
         """
         Filter documents based on user role and access.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Document.objects.all()
-        elif user.role == 'landlord':
-            return Document.objects.filter(
-                Q(property__landlord=user) | Q(uploaded_by=user)
-            )
-        elif user.role == 'tenant':
-            return Document.objects.filter(
-                Q(user=user) | Q(uploaded_by=user)
-            )
-        return Document.objects.none()
+        return self.filter_by_role(self.document_queryset())
+    
+    def role_conditions(self, user):
+        """
+        Return the conditions that each make a document visible to the user,
+        or None for no documents
+        
+        Besides their own documents, everyone sees the documents they uploaded.
+        """
+        if user.role == 'landlord':
+            return [Q(property__landlord=user), Q(uploaded_by=user)]
+        if user.role == 'tenant':
+            return [Q(user=user), Q(uploaded_by=user)]
+        condition = super().role_filter(user)
+        return None if condition is None else [condition]
+    
+    def role_filter(self, user):
+        """
+        OR of the role conditions; used for single documents, which are
+        looked up by primary key first
+        """
+        conditions = self.role_conditions(user)
+        if conditions is None:
+            return None
+        return reduce(operator.or_, conditions)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List documents as a UNION of one query per role condition
+        
+        The conditions are on different columns, and an OR of them ends in a
+        scan of the whole document table. Each UNION branch is filtered on its
+        own index instead; searching and filtering run inside every branch and
+        the combined rows are ordered and paginated once.
+        """
+        conditions = self.role_conditions(request.user)
+        if conditions is None or len(conditions) == 1:
+            return super().list(request, *args, **kwargs)
+        
+        branches = [
+            self.filter_queryset(self.document_queryset().filter(condition)).order_by()
+            for condition in conditions
+        ]
+        ordering = filters.OrderingFilter().get_ordering(request, branches[0], self)
+        queryset = branches[0].union(*branches[1:]).order_by(*ordering)
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
     
     def perform_create(self, serializer):
         """
@@ -400,7 +588,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
 # ==================== NOTIFICATION VIEWSET ====================
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(FreshAnnotationsMixin, RoleScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Notification model
     
@@ -409,25 +597,21 @@ class NotificationViewSet(viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['lease', 'category', 'priority', 'status']
+    filterset_class = NotificationFilter
     search_fields = ['subject', 'description']
     ordering_fields = ['created_at', 'priority']
+    ordering = ['-created_at']
+    landlord_lookup = 'lease__landlord'
+    tenant_lookup = 'lease__tenant'
     
     def get_queryset(self):
         """
         Filter notifications based on user role.
         """
-        user = self.request.user
-        if user.role == 'admin':
-            return Notification.objects.all()
-        elif user.role == 'landlord':
-            return Notification.objects.filter(lease__landlord=user)
-        elif user.role == 'tenant':
-            tenant_profile = getattr(user, 'tenant_profile', None)
-            if tenant_profile:
-                return Notification.objects.filter(lease__tenant=tenant_profile)
-            return Notification.objects.none()
-        return Notification.objects.none()
+        return self.filter_by_role(
+            with_lease_info(Notification.objects.annotate(**notification_names()))
+            .filter(lease__property__is_deleted=False)
+        )
     
     @action(detail=True, methods=['post'])
     def respond(self, request, pk=None):
@@ -450,41 +634,55 @@ class NotificationViewSet(viewsets.ModelViewSet):
         notification.responded_by = request.user
         notification.responded_at = timezone.now()
         notification.status = 'in_progress'
-        notification.save()
+        # Write only the changed columns; save() still sends post_save, which
+        # invalidates the cached dashboards
+        notification.save(update_fields=[
+            'landlord_response', 'responded_by', 'responded_at', 'status', 'updated_at'
+        ])
         
+        # Read it back so responded_by_name is annotated for the new responder
+        notification = self.get_queryset().get(pk=notification.pk)
         serializer = self.get_serializer(notification)
         return Response(serializer.data)
 
 
 # ==================== ACCOUNTING VIEWSETS ====================
 
-class AccountViewSet(viewsets.ModelViewSet):
+class AccountViewSet(FreshAnnotationsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Account model
     
     Manages chart of accounts for financial tracking.
     """
-    queryset = Account.objects.all()
+    queryset = Account.objects.select_related('ledger_balance').annotate(
+        parent_account_name=F('parent_account__name')
+    )
     serializer_class = AccountSerializer
     permission_classes = [IsAuthenticated, IsAdminOrLandlord]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['account_type', 'is_active']
+    filterset_class = AccountFilter
     search_fields = ['code', 'name', 'description']
     ordering_fields = ['code', 'name']
+    ordering = ['code']
 
 
-class JournalEntryViewSet(viewsets.ModelViewSet):
+class JournalEntryViewSet(FreshAnnotationsMixin, viewsets.ModelViewSet):
     """
     ViewSet for JournalEntry model
     
     Manages journal entries for double-entry bookkeeping.
     """
-    queryset = JournalEntry.objects.all()
+    queryset = JournalEntry.objects.annotate(
+        created_by_name=optional_full_name('created_by')
+    ).prefetch_related(
+        Prefetch('lines', queryset=JournalEntryLine.objects.annotate(account_name=F('account__name')))
+    )
     serializer_class = JournalEntrySerializer
     permission_classes = [IsAuthenticated, IsAdminOrLandlord]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['entry_date', 'created_by']
+    filterset_class = JournalEntryFilter
     ordering_fields = ['entry_date', 'created_at']
+    ordering = ['-entry_date']
     
     def perform_create(self, serializer):
         """
@@ -493,17 +691,18 @@ class JournalEntryViewSet(viewsets.ModelViewSet):
         serializer.save(created_by=self.request.user)
 
 
-class JournalEntryLineViewSet(viewsets.ModelViewSet):
+class JournalEntryLineViewSet(FreshAnnotationsMixin, viewsets.ModelViewSet):
     """
     ViewSet for JournalEntryLine model
     
     Manages individual debit/credit lines in journal entries.
     """
-    queryset = JournalEntryLine.objects.all()
+    queryset = JournalEntryLine.objects.annotate(account_name=F('account__name')).order_by('id')
     serializer_class = JournalEntryLineSerializer
     permission_classes = [IsAuthenticated, IsAdminOrLandlord]
+    pagination_class = LedgerCursorPagination
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['journal_entry', 'account']
+    filterset_class = JournalEntryLineFilter
 
 
 # ==================== DASHBOARD STATISTICS ====================
@@ -521,57 +720,72 @@ def dashboard_stats(request):
     - Admin: System-wide statistics
     - Landlord: Their properties, tenants, payments
     - Tenant: Their lease and payment info
+    
+    Results are cached per user for a short time and dropped whenever the
+    underlying records change (see signals.py).
     """
     user = request.user
-    
+    stats = cache.get_or_set(
+        dashboard_stats_key(user),
+        partial(build_dashboard_stats, user),
+        DASHBOARD_STATS_TIMEOUT,
+    )
+    return Response(stats)
+
+
+def build_dashboard_stats(user):
+    """
+    Compute the dashboard statistics for a user
+    """
     if user.role == 'admin':
         # Admin sees system-wide statistics
         stats = {
-            'total_properties': Property.objects.count(),
-            'total_units': Unit.objects.count(),
-            'total_tenants': Tenant.objects.count(),
-            'total_leases': Lease.objects.count(),
-            'active_leases': Lease.objects.filter(status='active').count(),
-            'total_payments': Payment.objects.count(),
-            'completed_payments': Payment.objects.filter(status='completed').count(),
-            'pending_payments': Payment.objects.filter(status='pending').count(),
-            'overdue_payments': Payment.objects.filter(status='overdue').count(),
-            'total_revenue': Payment.objects.filter(status='completed').aggregate(
-                total=Sum('amount')
-            )['total'] or 0,
+            **system_totals(),
             'recent_payments': PaymentSerializer(
-                Payment.objects.order_by('-created_at')[:5], 
+                with_lease_info(
+                    Payment.objects.filter(property__is_deleted=False).annotate(**payment_names())
+                ).order_by('-created_at')[:5],
                 many=True
             ).data,
         }
     
     elif user.role == 'landlord':
-        # Landlord sees their property statistics
+        # Landlord sees their property statistics (rows of deleted properties left out)
         properties = Property.objects.filter(landlord=user)
-        units = Unit.objects.filter(property__landlord=user)
-        leases = Lease.objects.filter(landlord=user)
-        payments = Payment.objects.filter(property__landlord=user)
+        units = Unit.objects.filter(property__landlord=user, property__is_deleted=False)
+        leases = Lease.objects.filter(landlord=user, property__is_deleted=False)
+        payments = Payment.objects.filter(property__landlord=user, property__is_deleted=False)
+        unit_counts = units.aggregate(
+            total=Count('id'),
+            occupied=Count('id', filter=Q(status='occupied')),
+            available=Count('id', filter=Q(status='available')),
+        )
+        payment_counts = payment_summary(payments)
         
         stats = {
             'total_properties': properties.count(),
-            'total_units': units.count(),
-            'occupied_units': units.filter(status='occupied').count(),
-            'available_units': units.filter(status='available').count(),
-            'total_tenants': Tenant.objects.filter(leases__landlord=user).distinct().count(),
+            'total_units': unit_counts['total'],
+            'occupied_units': unit_counts['occupied'],
+            'available_units': unit_counts['available'],
+            'total_tenants': Tenant.objects.filter(
+                leases__landlord=user, leases__property__is_deleted=False
+            ).distinct().count(),
             'active_leases': leases.filter(status='active').count(),
-            'total_payments': payments.count(),
-            'completed_payments': payments.filter(status='completed').count(),
-            'pending_payments': payments.filter(status='pending').count(),
-            'overdue_payments': payments.filter(status='overdue').count(),
-            'total_revenue': payments.filter(status='completed').aggregate(
-                total=Sum('amount')
-            )['total'] or 0,
+            'total_payments': payment_counts['total'],
+            'completed_payments': payment_counts['completed'],
+            'pending_payments': payment_counts['pending'],
+            'overdue_payments': payment_counts['overdue'],
+            'total_revenue': payment_counts['revenue'] or 0,
             'recent_payments': PaymentSerializer(
-                payments.order_by('-created_at')[:5], 
+                with_lease_info(payments.annotate(**payment_names())).order_by('-created_at')[:5], 
                 many=True
             ).data,
             'recent_notifications': NotificationSerializer(
-                Notification.objects.filter(lease__landlord=user).order_by('-created_at')[:5],
+                with_lease_info(Notification.objects.filter(
+                    lease__landlord=user, lease__property__is_deleted=False
+                ).annotate(
+                    **notification_names()
+                )).order_by('-created_at')[:5],
                 many=True
             ).data,
         }
@@ -580,26 +794,29 @@ def dashboard_stats(request):
         # Tenant sees their lease and payment info
         tenant_profile = getattr(user, 'tenant_profile', None)
         if tenant_profile:
-            leases = Lease.objects.filter(tenant=tenant_profile)
-            payments = Payment.objects.filter(tenant=tenant_profile)
+            active_lease = Lease.objects.filter(
+                tenant=tenant_profile, status='active', property__is_deleted=False
+            ).annotate(**lease_names()).order_by('-start_date').first()
+            payments = Payment.objects.filter(tenant=tenant_profile, property__is_deleted=False)
+            payment_counts = payment_summary(payments)
             
             stats = {
-                'active_lease': LeaseSerializer(
-                    leases.filter(status='active').first()
-                ).data if leases.filter(status='active').exists() else None,
-                'total_payments': payments.count(),
-                'completed_payments': payments.filter(status='completed').count(),
-                'pending_payments': payments.filter(status='pending').count(),
-                'overdue_payments': payments.filter(status='overdue').count(),
-                'total_paid': payments.filter(status='completed').aggregate(
-                    total=Sum('amount')
-                )['total'] or 0,
+                'active_lease': LeaseSerializer(active_lease).data if active_lease else None,
+                'total_payments': payment_counts['total'],
+                'completed_payments': payment_counts['completed'],
+                'pending_payments': payment_counts['pending'],
+                'overdue_payments': payment_counts['overdue'],
+                'total_paid': payment_counts['revenue'] or 0,
                 'recent_payments': PaymentSerializer(
-                    payments.order_by('-created_at')[:5], 
+                    with_lease_info(payments.annotate(**payment_names())).order_by('-created_at')[:5], 
                     many=True
                 ).data,
                 'my_notifications': NotificationSerializer(
-                    Notification.objects.filter(lease__tenant=tenant_profile).order_by('-created_at')[:5],
+                    with_lease_info(Notification.objects.filter(
+                        lease__tenant=tenant_profile, lease__property__is_deleted=False
+                    ).annotate(
+                        **notification_names()
+                    )).order_by('-created_at')[:5],
                     many=True
                 ).data,
             }
@@ -613,4 +830,4 @@ def dashboard_stats(request):
             'message': 'Invalid user role'
         }
     
-    return Response(stats)
+    return stats
@@ -1,11 +1,13 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 User = get_user_model()
 try:
-    u, created = User.objects.get_or_create(username='admin', defaults={'email':'admin@test.com'})
-    u.set_password('admin123')
-    u.is_superuser = True
-    u.is_staff = True
-    u.save()
+    u, created = User.objects.update_or_create(username='admin', defaults={
+        'email': 'admin@test.com',
+        'password': make_password('admin123'),
+        'is_superuser': True,
+        'is_staff': True,
+    })
     print({'created': created, 'username': u.username, 'id': u.id})
 except Exception as e:
     import traceback
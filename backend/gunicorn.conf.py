@@ -0,0 +1,42 @@
+"""
+Gunicorn configuration for rental_project
+
+Start the production server from the backend directory with:
+    gunicorn rental_project.wsgi
+
+Every setting can be overridden with an environment variable of the same
+name in upper case prefixed with GUNICORN_ (e.g. GUNICORN_WORKERS=4).
+"""
+
+import multiprocessing
+import os
+
+
+def env(name, default, cast=str):
+    return cast(os.environ.get(f'GUNICORN_{name}', default))
+
+
+bind = env('BIND', '0.0.0.0:8000')
+
+# Load Django once in the master process and fork the workers from it, so
+# the import cost is paid once and the loaded code is shared between workers
+preload_app = env('PRELOAD_APP', 'true', lambda value: value.lower() in ('1', 'true', 'yes'))
+
+# Threaded workers: mysqlclient is a C driver that gevent cannot patch, so
+# green threads would block each other on every query. Django keeps one
+# database connection per thread, so workers x threads must stay below the
+# database's max_connections (or use DB_POOL to share a pool per worker).
+worker_class = 'gthread'
+workers = env('WORKERS', multiprocessing.cpu_count() * 2 + 1, int)
+threads = env('THREADS', 4, int)
+
+timeout = env('TIMEOUT', 30, int)
+# Hold idle keep-alive connections from the reverse proxy for a few seconds
+keepalive = env('KEEPALIVE', 5, int)
+
+# Restart workers now and then to return memory fragmented by long runs
+max_requests = env('MAX_REQUESTS', 1000, int)
+max_requests_jitter = env('MAX_REQUESTS_JITTER', 100, int)
+
+accesslog = '-'
+errorlog = '-'
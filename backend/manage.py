@@ -29,12 +29,17 @@ def ensure_env_db_host(env_path='.env'):
                     changed = True
                 break
         else:
-            # not found, append
+            # not found, append (after a newline if the last line has none)
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
             lines.append('DB_HOST=127.0.0.1\n')
             changed = True
         if changed:
-            with open(env_path, 'w') as f:
+            # Write a temporary file and swap it in, so .env is never left half written
+            tmp_path = env_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 f.writelines(lines)
+            os.replace(tmp_path, env_path)
             print("[manage.py] Updated .env DB_HOST to 127.0.0.1 to force TCP MySQL connection")
     except Exception as e:
         print(f"[manage.py] Warning: failed to update .env: {e}")
@@ -6,6 +6,7 @@ This configuration uses MySQL database via XAMPP.
 """
 
 from pathlib import Path
+import importlib.util
 import os
 from decouple import config
 
@@ -20,14 +21,18 @@ SECRET_KEY = config('SECRET_KEY', default='django-insecure-change-this-key-in-pr
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=True, cast=bool)
 
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1').split(',')
+# Stripped and lowercased here so "a.com, B.com" matches the way Django compares Host headers
+ALLOWED_HOSTS = [
+    host.strip().lower()
+    for host in config('ALLOWED_HOSTS', default='localhost,127.0.0.1').split(',')
+    if host.strip()
+]
 
 
 # Application definition
 # These are all the apps used in this Django project
 
 INSTALLED_APPS = [
-    'django.contrib.admin',  # Admin panel
     'django.contrib.auth',  # Authentication system
     'django.contrib.contenttypes',  # Content types framework
     'django.contrib.sessions',  # Session management
@@ -44,8 +49,16 @@ INSTALLED_APPS = [
     'api',  # Our rental management API
 ]
 
+# Admin panel at /admin/ (set ENABLE_ADMIN=False on servers that only serve the API)
+ENABLE_ADMIN = config('ENABLE_ADMIN', default=True, cast=bool)
+
+if ENABLE_ADMIN:
+    INSTALLED_APPS.insert(0, 'django.contrib.admin')
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',  # Serves collected static files before the rest of the stack
+    'django.middleware.gzip.GZipMiddleware',  # Compress responses for clients that accept gzip
     'corsheaders.middleware.CorsMiddleware',  # Must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -55,6 +68,18 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+if not ENABLE_ADMIN:
+    # Sessions and messages are only used by the admin panel; API requests
+    # authenticate with JWT, so skip them (and the session-based auth middleware)
+    ADMIN_ONLY_APPS = {'django.contrib.sessions', 'django.contrib.messages'}
+    ADMIN_ONLY_MIDDLEWARE = {
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    }
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in ADMIN_ONLY_APPS]
+    MIDDLEWARE = [name for name in MIDDLEWARE if name not in ADMIN_ONLY_MIDDLEWARE]
+
 ROOT_URLCONF = 'rental_project.urls'
 
 TEMPLATES = [
@@ -80,20 +105,94 @@ WSGI_APPLICATION = 'rental_project.wsgi.application'
 # This connects to MySQL running on localhost (XAMPP)
 # Default XAMPP user is 'root' with no password
 
+DB_ENGINE = config('DB_ENGINE', default='django.db.backends.mysql')
+
 DATABASES = {
     'default': {
-        'ENGINE': config('DB_ENGINE', default='django.db.backends.mysql'),
+        'ENGINE': DB_ENGINE,
         'NAME': config('DB_NAME', default='rental_management'),
         'USER': config('DB_USER', default='root'),
         'PASSWORD': config('DB_PASSWORD', default=''),  # Empty password for XAMPP default
         'HOST': config('DB_HOST', default='127.0.0.1'),
         'PORT': config('DB_PORT', default='3306'),
-        'OPTIONS': {
-            'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
-        },
+        # Keep connections open between requests instead of reconnecting
+        # every time; health checks drop connections the server has closed.
+        # One connection is held per worker thread, so keep workers x threads
+        # below the server's max_connections.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+}
+
+if DB_ENGINE == 'django.db.backends.mysql':
+    # Full UTF-8 (utf8mb4), set once when connecting. Django already runs
+    # MySQL connections at READ COMMITTED, so no isolation_level is needed.
+    DATABASES['default']['OPTIONS'] = {
+        'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+        'charset': 'utf8mb4',
     }
+elif DB_ENGINE == 'django.db.backends.postgresql':
+    # With psycopg 3, queries run this many times on a connection are
+    # prepared on the server so they are only parsed and planned once.
+    # Behind PgBouncer in transaction mode set DB_PREPARE_THRESHOLD=0 (prepared
+    # statements do not survive between transactions there) and
+    # DB_DISABLE_SERVER_SIDE_CURSORS=True.
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = config(
+        'DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool
+    )
+    if importlib.util.find_spec('psycopg') is not None:
+        prepare_threshold = config('DB_PREPARE_THRESHOLD', default=5, cast=int)
+        DATABASES['default']['OPTIONS'] = {
+            'prepare_threshold': prepare_threshold or None,
+        }
+
+# Connection pool (optional, requires django-db-connection-pool)
+# Shares a pool of open connections between the threads of each process
+# instead of one persistent connection per thread. Keep DB_POOL_SIZE plus
+# DB_POOL_MAX_OVERFLOW, times the number of processes, below the server's
+# max_connections.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+
+POOLED_ENGINES = {
+    'django.db.backends.mysql': 'dj_db_conn_pool.backends.mysql',
+    'django.db.backends.postgresql': 'dj_db_conn_pool.backends.postgresql',
 }
 
+if DB_POOL and DB_ENGINE in POOLED_ENGINES:
+    DATABASES['default']['ENGINE'] = POOLED_ENGINES[DB_ENGINE]
+    # Hand the connection back to the pool after every request
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['POOL_OPTIONS'] = {
+        'POOL_SIZE': config('DB_POOL_SIZE', default=10, cast=int),
+        'MAX_OVERFLOW': config('DB_POOL_MAX_OVERFLOW', default=10, cast=int),
+        'RECYCLE': 300,
+        'PRE_PING': True,
+    }
+
+
+# Cache Configuration
+# Shared Redis cache when REDIS_URL is set, otherwise a per-process memory cache
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Sessions (admin and browsable API logins) are read from the cache and only
+# fall back to the database on a miss
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -127,9 +226,45 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# WhiteNoise serves static files from STATIC_ROOT (run collectstatic first).
+# Files get content-hashed names and compressed copies at collectstatic time,
+# so they can be cached forever and never need compressing per request.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
+
+# Object storage for uploaded files (optional, requires django-storages and boto3)
+# When enabled, uploads stream to S3 (or any S3-compatible store) in parallel
+# multipart chunks and files are served from the bucket instead of Django.
+USE_S3_STORAGE = config('USE_S3_STORAGE', default=False, cast=bool)
+
+if USE_S3_STORAGE:
+    from boto3.s3.transfer import TransferConfig
+
+    STORAGES['default'] = {'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage'}
+    AWS_STORAGE_BUCKET_NAME = config('AWS_STORAGE_BUCKET_NAME')
+    AWS_S3_REGION_NAME = config('AWS_S3_REGION_NAME', default=None)
+    AWS_S3_ENDPOINT_URL = config('AWS_S3_ENDPOINT_URL', default=None)
+    AWS_S3_CUSTOM_DOMAIN = config('AWS_S3_CUSTOM_DOMAIN', default=None)  # CDN domain, if any
+    AWS_ACCESS_KEY_ID = config('AWS_ACCESS_KEY_ID', default=None)
+    AWS_SECRET_ACCESS_KEY = config('AWS_SECRET_ACCESS_KEY', default=None)
+    AWS_S3_FILE_OVERWRITE = False
+    # Uploaded files never change in place, so let browsers and the CDN cache them
+    AWS_S3_OBJECT_PARAMETERS = {'CacheControl': 'public, max-age=31536000'}
+    AWS_S3_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        max_concurrency=10,
+        use_threads=True,
+    )
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# MySQL cannot enforce the conditional unique constraint on primary property
+# images; PropertyImage.save() keeps it there instead
+SILENCED_SYSTEM_CHECKS = ['models.W036']
+
 # Custom User Model
 # We use a custom user model to add role field (admin, landlord, tenant)
 AUTH_USER_MODEL = 'api.User'
@@ -140,34 +275,49 @@ AUTH_USER_MODEL = 'api.User'
 REST_FRAMEWORK = {
     # Use JWT tokens for authentication
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.JWTAuthentication',
     ),
     # Require authentication by default
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Render JSON with orjson (the browsable API is added below when DEBUG)
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.ORJSONRenderer',
+    ),
+    # The frontend sends JSON (parsed with orjson), and multipart for file uploads
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     # Enable filtering
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ),
-    # Pagination settings
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # Pagination settings (estimated counts for large unfiltered tables)
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.LargeTablePagination',
     'PAGE_SIZE': 10,
 }
 
+if DEBUG:
+    # Browsable API and its HTML forms for development
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] += ('rest_framework.renderers.BrowsableAPIRenderer',)
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] += ('rest_framework.parsers.FormParser',)
+
 # JWT Settings
 # Configuration for JSON Web Tokens used for authentication
 from datetime import timedelta
 
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(days=1),  # Token valid for 1 day
+    # Short-lived access tokens; the frontend refreshes them on a 401
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),  # Refresh token valid for 7 days
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': True,
     'ALGORITHM': 'HS256',
-    'SIGNING_KEY': SECRET_KEY,
+    'SIGNING_KEY': SECRET_KEY,  # Encoded to key bytes once per process by simplejwt
     'VERIFYING_KEY': None,
     'AUTH_HEADER_TYPES': ('Bearer',),
     'USER_ID_FIELD': 'id',
@@ -186,7 +336,7 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 # Allow specific headers
-CORS_ALLOW_HEADERS = [
+CORS_ALLOW_HEADERS = (
     'accept',
     'accept-encoding',
     'authorization',
@@ -196,4 +346,8 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
-]
+)
+
+# Let browsers cache preflight (OPTIONS) responses for a day, so only the
+# first cross-origin request to a URL pays for the extra round trip
+CORS_PREFLIGHT_MAX_AGE = 86400
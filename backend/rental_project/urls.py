@@ -4,21 +4,23 @@ URL Configuration for rental_project
 This file defines the URL patterns for the entire Django project.
 It routes incoming requests to the appropriate views/endpoints.
 """
-from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
-    # Admin panel - accessible at /admin/
-    path('admin/', admin.site.urls),
-    
     # API endpoints - all API routes are under /api/
     path('api/', include('api.urls')),
 ]
 
+# Admin panel - accessible at /admin/ unless ENABLE_ADMIN is off
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
+
 # Serve media files in development
 # Media files are user-uploaded content like images, documents, etc.
+# Static files are served by WhiteNoise (see MIDDLEWARE in settings.py).
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
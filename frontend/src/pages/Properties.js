@@ -185,16 +185,14 @@ const Properties = () => {
  * Displays individual property information
  */
 const PropertyCard = ({ property, onEdit, onDelete, canEdit }) => {
-  // Get the first image or use placeholder
-  const imageUrl = property.images && property.images.length > 0
-    ? property.images[0].image
-    : '/placeholder-property.jpg';
+  // Listing responses carry only the card image (primary_image)
+  const imageUrl = property.primary_image || '/placeholder-property.jpg';
   
   return (
     <div className="bg-white rounded-lg shadow-md overflow-hidden hover:shadow-lg transition-shadow">
       {/* Property Image */}
       <div className="h-48 bg-gray-200 relative">
-        {property.images && property.images.length > 0 ? (
+        {property.primary_image ? (
           <img
             src={imageUrl}
             alt={property.name}